@@ -5,38 +5,48 @@ Provides health checks and status information for the encryption service.
 """
 
 from fastapi import APIRouter
-from typing import Dict, Any
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, Optional
 import structlog
 
-from app.services.encryption_service import EncryptionService
+from app.services.encryption_service import FILE_ALGORITHM, get_encryption_service
 
 logger = structlog.get_logger()
-router = APIRouter(prefix="/api/encryption", tags=["encryption"])
+router = APIRouter(
+    prefix="/api/encryption", tags=["encryption"], default_response_class=ORJSONResponse
+)
+
+HEALTH_CHECK_PLAINTEXT = b"health check test"
+
+# Sentinel encrypted once with the cached service; each health check only
+# decrypts it. Reset on failure so the next check re-initializes.
+_health_check_token: Optional[bytes] = None
+
 
 @router.get("/health")
 async def encryption_health() -> Dict[str, Any]:
     """
     Check encryption service health status
     """
+    global _health_check_token
     try:
-        # Initialize encryption service to test functionality
-        encryption_service = EncryptionService()
+        encryption_service = get_encryption_service()
+        if _health_check_token is None:
+            _health_check_token = encryption_service.encrypt_data(HEALTH_CHECK_PLAINTEXT)
 
-        # Test basic encryption/decryption
-        test_data = b"health check test"
-        encrypted = encryption_service.fernet.encrypt(test_data)
-        decrypted = encryption_service.fernet.decrypt(encrypted)
+        decrypted = encryption_service.decrypt_data(_health_check_token)
 
-        if decrypted == test_data:
+        if decrypted == HEALTH_CHECK_PLAINTEXT:
             logger.info("Encryption health check passed")
             return {
                 "status": "healthy",
                 "message": "Encryption service operational",
                 "encryption_available": True,
-                "key_derivation": "PBKDF2-HMAC-SHA256",
-                "algorithm": "Fernet (AES 128 CBC + HMAC SHA256)"
+                "key_derivation": "PBKDF2-HMAC-SHA256 + HKDF-SHA256",
+                "algorithm": FILE_ALGORITHM
             }
         else:
+            _health_check_token = None
             logger.error("Encryption health check failed - data corruption")
             return {
                 "status": "unhealthy",
@@ -45,6 +55,8 @@ async def encryption_health() -> Dict[str, Any]:
             }
 
     except Exception as e:
+        _health_check_token = None
+        get_encryption_service.cache_clear()
         logger.error(
             "Encryption health check failed",
             error=str(e),
@@ -55,4 +67,4 @@ async def encryption_health() -> Dict[str, Any]:
             "message": f"Encryption service error: {type(e).__name__}",
             "encryption_available": False,
             "error": str(e)
-        }
\ No newline at end of file
+        }
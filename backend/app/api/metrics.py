@@ -5,11 +5,11 @@ Provides access to parsing performance metrics, success rates,
 and system health indicators.
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 from typing import Optional, Dict, Any
 import structlog
 
-from app.core.metrics import get_metrics_collector
+from app.core.metrics import dumps_json, get_metrics_collector
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/api/metrics", tags=["metrics"])
@@ -50,7 +50,7 @@ async def get_metrics_summary(
         summary["time_window_hours"] = hours
         summary["status"] = "success"
 
-        logger.info(
+        logger.debug(
             "Metrics summary requested",
             time_window_hours=hours,
             total_events=len(metrics_collector.events),
@@ -104,7 +104,7 @@ async def get_parse_metrics(
             }
         }
 
-        logger.info(
+        logger.debug(
             "Parse metrics requested",
             time_window_hours=hours,
             total_parses=parse_metrics.total_parses,
@@ -128,7 +128,7 @@ async def get_parse_metrics(
 @router.get("/events")
 async def get_recent_events(
     limit: Optional[int] = Query(100, description="Maximum number of events", ge=1, le=1000)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get recent metric events for debugging and monitoring
 
@@ -142,18 +142,23 @@ async def get_recent_events(
         metrics_collector = get_metrics_collector()
         events = metrics_collector.get_recent_events(limit=limit)
 
-        logger.info(
+        logger.debug(
             "Recent events requested",
             limit=limit,
             events_returned=len(events)
         )
 
-        return {
-            "status": "success",
-            "limit": limit,
-            "events_returned": len(events),
-            "events": events
-        }
+        # Event dicts are plain JSON types; serialize once and skip FastAPI's
+        # jsonable_encoder walk over up to `limit` nested dicts
+        return Response(
+            content=dumps_json({
+                "status": "success",
+                "limit": limit,
+                "events_returned": len(events),
+                "events": events
+            }),
+            media_type="application/json"
+        )
 
     except Exception as e:
         logger.error(
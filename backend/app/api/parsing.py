@@ -3,21 +3,83 @@ Resume parsing API endpoints
 """
 
 from fastapi import APIRouter, HTTPException, Request, Query, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import structlog
 from datetime import datetime
 import uuid
+import fnmatch
+import functools
 import glob
 import os
+import re
 from pathlib import Path
+from typing import Optional
 
 from app.models.schemas import ParsingJob, ParsingJobResponse, ErrorResponse
 from app.services.parser_service import ParserService
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger()
 
+_RUN_ID_PLACEHOLDER = re.compile(r"\[RUN_ID\]")
+
+
+def _find_first_match(pattern: str) -> Optional[str]:
+    """
+    Find the first existing path matching a pattern with a single wildcard
+
+    Only the directory holding the wildcard component is listed (one scandir
+    pass), stopping at the first hit instead of globbing every match. Results
+    are memoized against that directory's mtime, so repeated lookups skip the
+    scan until a new entry appears there.
+    """
+    head, _, tail = pattern.partition("*")
+    if "*" in tail:
+        # Multiple placeholders: fall back to a full glob
+        matches = glob.glob(pattern)
+        return matches[0] if matches else None
+
+    base_dir = os.path.dirname(head)
+    try:
+        dir_mtime_ns = os.stat(base_dir or ".").st_mtime_ns
+        resolved = _scan_for_match(pattern, dir_mtime_ns)
+    except (OSError, LookupError):
+        return None
+
+    if not os.path.exists(resolved):
+        # Removed since it was cached; rescan on the next lookup
+        _scan_for_match.cache_clear()
+        return None
+    return resolved
+
+
+@functools.lru_cache(maxsize=1024)
+def _scan_for_match(pattern: str, dir_mtime_ns: int) -> str:
+    """
+    Scan for a single-wildcard pattern; raises LookupError when nothing matches
+
+    Misses raise rather than return None so lru_cache does not remember them:
+    a run directory can gain its file without the parent mtime changing.
+    """
+    head, _, tail = pattern.partition("*")
+    base_dir, name_prefix = os.path.split(head)
+    name_suffix, _, remainder = tail.partition("/")
+    component_glob = f"{name_prefix}*{name_suffix}"
+
+    with os.scandir(base_dir or ".") as entries:
+        for entry in entries:
+            # Match glob semantics: '*' does not match hidden entries
+            if entry.name.startswith(".") and not component_glob.startswith("."):
+                continue
+            if not fnmatch.fnmatchcase(entry.name, component_glob):
+                continue
+            candidate = os.path.join(base_dir, entry.name, remainder) if remainder else entry.path
+            if not remainder or os.path.exists(candidate):
+                return candidate
+
+    raise LookupError(pattern)
+
 
 def resolve_placeholder_path(file_path: str) -> str:
     """
@@ -29,12 +91,11 @@ def resolve_placeholder_path(file_path: str) -> str:
     Returns:
         Resolved file path with actual run_id
     """
-    if "[RUN_ID]" not in file_path:
+    # Replace [RUN_ID] with wildcard for glob matching (one scan detects and substitutes)
+    pattern, placeholders = _RUN_ID_PLACEHOLDER.subn("*", file_path)
+    if not placeholders:
         return file_path
 
-    # Replace [RUN_ID] with wildcard for glob matching
-    pattern = file_path.replace("[RUN_ID]", "*")
-
     # Convert to absolute path relative to data directory
     if not pattern.startswith("/"):
         # Remove 'data/' prefix if present to avoid duplication
@@ -44,18 +105,13 @@ def resolve_placeholder_path(file_path: str) -> str:
 
     logger.debug("Resolving path pattern", pattern=pattern, original_path=file_path)
 
-    # Find matching files
-    matches = glob.glob(pattern)
+    # Find the first matching file
+    resolved_path = _find_first_match(pattern)
 
-    if not matches:
+    if resolved_path is None:
         logger.warning("No files found matching pattern", pattern=pattern, original_path=file_path)
         return file_path  # Return original path if no matches
 
-    if len(matches) > 1:
-        logger.warning("Multiple files found matching pattern", pattern=pattern, matches=matches[:3])
-
-    # Return the first match (most recent)
-    resolved_path = matches[0]
     logger.info("Path resolved successfully", original=file_path, resolved=resolved_path)
 
     return resolved_path
@@ -114,7 +170,7 @@ async def run_parsing_job(
             processing_time_ms=result.processing_time_ms
         )
 
-        logger.info(
+        logger.debug(
             "Parsing job API response ready",
             request_id=request_id,
             job_id=job_id,
@@ -123,7 +179,9 @@ async def run_parsing_job(
             warnings_count=len(result.warnings) if result.warnings else 0
         )
 
-        return result
+        # Built from trusted values via model_construct (not validated); skip
+        # FastAPI's re-validation and re-serialization
+        return ORJSONResponse(result.model_dump(mode="json"))
 
     except ValueError as e:
         logger.warning(
@@ -242,7 +300,9 @@ async def run_parsing_job_from_file(
             processing_time_ms=result.processing_time_ms
         )
 
-        return result
+        # Built from trusted values via model_construct (not validated); skip
+        # FastAPI's re-validation and re-serialization
+        return ORJSONResponse(result.model_dump(mode="json"))
 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -313,7 +373,9 @@ async def get_parsing_job_status(
             status=result.status
         )
 
-        return result
+        # Built from trusted values via model_construct (not validated); skip
+        # FastAPI's re-validation and re-serialization
+        return ORJSONResponse(result.model_dump(mode="json"))
 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -3,19 +3,68 @@ File upload endpoints
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
+import json
 import structlog
 from datetime import datetime
+from typing import Optional
 import uuid
 
 from app.models.schemas import UploadResponse, ErrorResponse, FileValidationError
-from app.services.file_service import FileService
+from app.services.file_service import FileService, FileSizeError
 from app.core.config import settings
 from app.core.database import db
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = structlog.get_logger()
 
+# Resume row plus its artifact row, inserted atomically in one round-trip
+INSERT_RESUME_WITH_ARTIFACT = """
+WITH resume AS (
+    INSERT INTO resumes (id, user_id, title, content, metadata)
+    VALUES ($1, $2, $3, $4, $5)
+    RETURNING id
+)
+INSERT INTO artifacts (id, user_id, resume_id, file_path, file_name,
+                       file_size, mime_type, checksum)
+SELECT $6, $2, resume.id, $7, $8, $9, $10, $11
+FROM resume
+"""
+
+# Uploads are owned by the default admin user, looked up (or created) once
+_admin_user_id: Optional[str] = None
+_admin_user_lock = asyncio.Lock()
+
+
+async def _get_admin_user_id() -> str:
+    """Get or create the default admin user, caching its id for the process"""
+    global _admin_user_id
+    if _admin_user_id is not None:
+        return _admin_user_id
+
+    async with _admin_user_lock:
+        if _admin_user_id is not None:
+            return _admin_user_id
+
+        existing_id = await db.fetch_val(
+            "SELECT id FROM users WHERE email = 'admin@scout.local' LIMIT 1"
+        )
+        if existing_id is not None:
+            _admin_user_id = str(existing_id)
+        else:
+            # Create admin user if doesn't exist
+            admin_user_id = str(uuid.uuid4())
+            await db.execute(
+                "INSERT INTO users (id, email, settings) VALUES ($1, $2, $3)",
+                admin_user_id,
+                "admin@scout.local",
+                '{"role": "admin", "created_by": "upload_endpoint"}'
+            )
+            _admin_user_id = admin_user_id
+
+        return _admin_user_id
+
 
 @router.post("/resume", response_model=UploadResponse)
 async def upload_resume(
@@ -53,8 +102,9 @@ async def upload_resume(
                 }
             )
 
-        # Validate file type
-        if not FileService.validate_file_type(file.filename):
+        # Validate file type and resolve its MIME type in one pass
+        mime_type = FileService.classify_file(file.filename)
+        if mime_type is None:
             logger.warning(
                 "File type validation failed",
                 request_id=request_id,
@@ -72,83 +122,48 @@ async def upload_resume(
                 }
             )
 
-        # Read file content
-        file_content = await file.read()
-        file_size = len(file_content)
-
-        # Validate file size
-        if not FileService.validate_file_size(file_size):
+        # Stream to disk, hashing and size-checking as it is read
+        try:
+            full_path, api_path, checksum, file_size = await FileService.store_upload(
+                file, file.filename, run_id
+            )
+        except FileSizeError as e:
             logger.warning(
                 "File size validation failed",
                 request_id=request_id,
                 run_id=run_id,
                 filename=file.filename,
-                file_size=file_size,
+                file_size=e.file_size,
                 max_size=settings.MAX_FILE_SIZE,
-                human_readable_size=FileService.format_file_size(file_size),
+                human_readable_size=FileService.format_file_size(e.file_size),
             )
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail={
                     "error": "file_too_large",
-                    "message": f"File size ({FileService.format_file_size(file_size)}) exceeds maximum allowed size ({FileService.format_file_size(settings.MAX_FILE_SIZE)})",
+                    "message": f"File size ({FileService.format_file_size(e.file_size)}) exceeds maximum allowed size ({FileService.format_file_size(settings.MAX_FILE_SIZE)})",
                     "request_id": request_id,
                     "filename": file.filename,
                 }
             )
 
-        # Store file and get metadata
-        full_path, api_path, checksum = await FileService.store_file(
-            file_content, file.filename, run_id
-        )
-
-        # Get MIME type
-        mime_type = FileService.get_mime_type(file.filename)
-
         # Generate IDs
         resume_id = str(uuid.uuid4())
         artifact_id = str(uuid.uuid4())
 
         # Store in database
         try:
-            # Get or create default admin user
-            admin_user = await db.fetch_one(
-                "SELECT id FROM users WHERE email = 'admin@scout.local' LIMIT 1"
-            )
-            if not admin_user:
-                # Create admin user if doesn't exist
-                admin_user_id = str(uuid.uuid4())
-                await db.execute(
-                    "INSERT INTO users (id, email, settings) VALUES ($1, $2, $3)",
-                    admin_user_id,
-                    "admin@scout.local",
-                    '{"role": "admin", "created_by": "upload_endpoint"}'
-                )
-                admin_user = {"id": admin_user_id}
-
-            # Create resume record
+            admin_user_id = await _get_admin_user_id()
+
+            # Create resume and artifact records in one statement/round-trip
             await db.execute(
-                """
-                INSERT INTO resumes (id, user_id, title, content, metadata)
-                VALUES ($1, $2, $3, $4, $5)
-                """,
+                INSERT_RESUME_WITH_ARTIFACT,
                 resume_id,
-                admin_user["id"],
+                admin_user_id,
                 file.filename or "Untitled Resume",
                 '{}',
-                '{"source": "upload", "run_id": "' + run_id + '"}'
-            )
-
-            # Create artifact record
-            await db.execute(
-                """
-                INSERT INTO artifacts (id, user_id, resume_id, file_path, file_name,
-                                     file_size, mime_type, checksum)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                """,
+                json.dumps({"source": "upload", "run_id": run_id}),
                 artifact_id,
-                admin_user["id"],
-                resume_id,
                 str(full_path),  # Store full path for parser to find
                 file.filename,
                 file_size,
@@ -171,7 +186,7 @@ async def upload_resume(
             )
 
         # Create response
-        response = UploadResponse(
+        response = UploadResponse.from_trusted(
             resume_id=resume_id,
             run_id=run_id,
             file_hash=checksum,
@@ -195,7 +210,9 @@ async def upload_resume(
             storage_path=api_path,
         )
 
-        return response
+        # Built from trusted values via model_construct (not validated); skip
+        # FastAPI's re-validation and re-serialization
+        return ORJSONResponse(response.model_dump(mode="json"))
 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
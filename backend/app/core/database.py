@@ -3,31 +3,74 @@ Database connection and utilities for SCOUT Backend
 """
 
 import asyncpg
-from typing import Optional, Dict, Any, List
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 import structlog
 from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# Hot lookups kept as constants so every call reuses one entry in each
+# connection's prepared-statement cache.
+#
+# Most recent artifact of a resume, falling back to an artifact whose own id
+# was passed (some uploads have no resume record yet), in one round trip.
+# Both branches are index lookups; priority makes the resume match win
+RESUME_FILE_PATH = """
+SELECT file_path
+FROM (
+    (
+        SELECT file_path, 0 AS priority
+        FROM artifacts
+        WHERE resume_id = $1
+        ORDER BY created_at DESC
+        LIMIT 1
+    )
+    UNION ALL
+    (
+        SELECT file_path, 1 AS priority
+        FROM artifacts
+        WHERE id = $1
+    )
+) AS candidates
+ORDER BY priority
+LIMIT 1
+"""
+
+# Resume file paths do not change after upload, so found paths are kept
+# in-process for a while (LRU-bounded); misses always go to the database
+RESUME_FILE_PATH_CACHE_SIZE = 4096
+RESUME_FILE_PATH_CACHE_TTL = 300.0  # seconds
+
 
 class Database:
     """Simple database connection wrapper"""
 
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
+        # resume_id -> (expiry on the monotonic clock, file_path)
+        self._file_path_cache: OrderedDict[str, Tuple[float, str]] = OrderedDict()
 
     async def connect(self):
         """Initialize database connection pool"""
         try:
             self.pool = await asyncpg.create_pool(
                 settings.DATABASE_URL,
-                min_size=1,
-                max_size=10,
+                # min_size connections are opened here, before the first request
+                min_size=settings.DB_POOL_MIN_SIZE,
+                max_size=settings.DB_POOL_MAX_SIZE,
+                command_timeout=settings.DB_COMMAND_TIMEOUT,
+                statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
                 server_settings={
                     'jit': 'off'  # Disable JIT for better performance on small queries
                 }
             )
-            logger.info("Database connection pool created")
+            logger.info(
+                "Database connection pool created",
+                min_size=settings.DB_POOL_MIN_SIZE,
+                max_size=settings.DB_POOL_MAX_SIZE,
+            )
         except Exception as e:
             logger.error("Failed to create database pool", error=str(e))
             raise
@@ -47,14 +90,26 @@ class Database:
             result = await conn.fetchrow(query, *args)
             return dict(result) if result else None
 
-    async def fetch_all(self, query: str, *args) -> List[Dict[str, Any]]:
-        """Execute query and fetch all results"""
+    async def fetch_val(self, query: str, *args, column: int = 0) -> Any:
+        """Execute query and fetch a single value from the first row"""
         if not self.pool:
             await self.connect()
 
         async with self.pool.acquire() as conn:
-            results = await conn.fetch(query, *args)
-            return [dict(row) for row in results]
+            return await conn.fetchval(query, *args, column=column)
+
+    async def fetch_all(self, query: str, *args) -> List[asyncpg.Record]:
+        """
+        Execute query and fetch all results
+
+        Records support row["column"] access; convert with dict(row) only
+        where a plain dict is needed (e.g. JSON serialization)
+        """
+        if not self.pool:
+            await self.connect()
+
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(query, *args)
 
     async def execute(self, query: str, *args) -> str:
         """Execute query and return status"""
@@ -67,33 +122,31 @@ class Database:
     async def get_resume_file_path(self, resume_id: str) -> Optional[str]:
         """
         Get the file path for a resume by its ID
-        Looks up the most recent artifact for the resume
-        """
-        query = """
-        SELECT file_path, file_name
-        FROM artifacts
-        WHERE resume_id = $1
-        ORDER BY created_at DESC
-        LIMIT 1
+        Looks up the most recent artifact for the resume, or the artifact
+        with that ID if the resume has none
         """
-
-        result = await self.fetch_one(query, resume_id)
-        if result and result.get('file_path'):
-            # Return the full path to the stored file
-            return result['file_path']
-
-        # Fallback: try to find by resume_id in artifacts table
-        # Some uploads might not create resume records yet
-        query_artifact = """
-        SELECT file_path, file_name
-        FROM artifacts
-        WHERE id = $1
-        ORDER BY created_at DESC
-        LIMIT 1
-        """
-
-        result = await self.fetch_one(query_artifact, resume_id)
-        return result['file_path'] if result else None
+        now = time.monotonic()
+        cached = self._file_path_cache.get(resume_id)
+        if cached is not None:
+            expires_at, file_path = cached
+            if expires_at > now:
+                self._file_path_cache.move_to_end(resume_id)
+                return file_path
+            del self._file_path_cache[resume_id]
+
+        file_path = await self.fetch_val(RESUME_FILE_PATH, resume_id)
+        if file_path is not None:
+            self._file_path_cache[resume_id] = (now + RESUME_FILE_PATH_CACHE_TTL, file_path)
+            if len(self._file_path_cache) > RESUME_FILE_PATH_CACHE_SIZE:
+                self._file_path_cache.popitem(last=False)
+        return file_path
+
+    def invalidate_resume_file_path(self, resume_id: Optional[str] = None) -> None:
+        """Drop a cached resume file path (all of them if no ID is given)"""
+        if resume_id is None:
+            self._file_path_cache.clear()
+        else:
+            self._file_path_cache.pop(resume_id, None)
 
 
 # Global database instance
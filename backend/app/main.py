@@ -12,6 +12,8 @@ import uuid
 
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.metrics import get_metrics_collector
+from app.core.pii_redaction import pii_redactor
 from app.api import uploads, parsing, metrics, encryption
 
 # Setup structured logging
@@ -35,39 +37,69 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def start_metrics_writer():
+    """Create the metrics collector and stream its events to disk"""
+    await get_metrics_collector().start_event_writer()
+
+
+@app.on_event("shutdown")
+async def stop_metrics_writer():
+    """Flush any queued metric events before exit"""
+    await get_metrics_collector().stop_event_writer()
+
+
+# Health probes and the root banner are polled constantly; not worth a log line
+UNLOGGED_PATHS = frozenset({"/health", "/"})
+
+
 @app.middleware("http")
 async def logging_middleware(request: Request, call_next):
     """Log all requests with structured logging and PII redaction"""
-    start_time = time.time()
+    # Every request gets an ID; only polled paths skip the log lines
+    log_request = request.url.path not in UNLOGGED_PATHS
+
+    start_ns = time.perf_counter_ns()
     request_id = str(uuid.uuid4())
 
     # Add request ID to request state for use in endpoints
     request.state.request_id = request_id
 
     # Log request start
-    logger.info(
-        "Request started",
-        request_id=request_id,
-        method=request.method,
-        path=request.url.path,
-        query_params=dict(request.query_params),
-        user_agent=request.headers.get("user-agent", ""),
-    )
+    if log_request:
+        logger.info(
+            "Request started",
+            request_id=request_id,
+            method=request.method,
+            path=request.url.path,
+            # Decoded key/value pairs, so PII redaction sees keys like email=
+            # and unescaped values; most requests have none
+            query_params=dict(request.query_params) if request.query_params else {},
+            user_agent=request.headers.get("user-agent", ""),
+        )
 
     response = await call_next(request)
 
-    # Calculate processing time
-    process_time = time.time() - start_time
-
-    # Log request completion
-    logger.info(
-        "Request completed",
-        request_id=request_id,
-        method=request.method,
-        path=request.url.path,
-        status_code=response.status_code,
-        process_time=round(process_time, 4),
-    )
+    if log_request:
+        # Calculate processing time
+        process_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+        # Log request completion. Every field is an ID, enum or number except
+        # the path; with redaction on, the path is redacted here so the event
+        # can skip the PII processor (the only place the sentinel is consumed).
+        if settings.PII_REDACTION_ENABLED:
+            path_fields = {"_skip_redaction": True, "path": pii_redactor.redact_text(request.url.path)}
+        else:
+            path_fields = {"path": request.url.path}
+
+        logger.info(
+            "Request completed",
+            request_id=request_id,
+            method=request.method,
+            status_code=response.status_code,
+            process_time=round(process_time, 4),
+            **path_fields,
+        )
 
     # Add request ID to response headers
     response.headers["X-Request-ID"] = request_id
@@ -3,15 +3,56 @@ Comprehensive Profile JSON Schema for SCOUT Resume Parser
 Defines the formal structure for parsed resume profiles with versioning and validation.
 """
 
-from pydantic import BaseModel, Field, validator, model_validator
-from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, field_validator, model_validator
+from typing import Annotated, Literal, Optional, List, Dict, Any, Union
 from datetime import datetime, date
 from enum import Enum
+import functools
 import re
 
+# Linear-time RE2 engine for the contact validators when installed
+try:
+    import re2 as _contact_re
+except ImportError:
+    _contact_re = re
+
 # Schema version for tracking compatibility
 PROFILE_SCHEMA_VERSION = "1.0.0"
 
+# Validator patterns, compiled once. Contact fields hold untrusted resume
+# text, so they use RE2 when available (no backtracking, no ReDoS)
+_EMAIL_RE = _contact_re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+_PHONE_CLEAN_RE = _contact_re.compile(r'[\s\-\(\)\+\.]')
+_PHONE_DIGITS_RE = _contact_re.compile(r'^\d{7,15}$')
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
+# Derived demographic fields a profile must never carry
+_PROHIBITED_DERIVED_FIELDS = frozenset({'age', 'gender', 'race', 'nationality', 'marital_status'})
+
+# Date formats accepted by DateRangeSchema, each behind a pattern for its
+# shape (as loose as strptime's own), so at most one strptime call is made
+_DATE_DISPATCH = (
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}'), '%Y-%m-%d'),
+    (re.compile(r'\d{4}-\d{1,2}'), '%Y-%m'),
+    (re.compile(r'\d{4}'), '%Y'),
+    (re.compile(r'\d{1,2}/\d{4}'), '%m/%Y'),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), '%m/%d/%Y'),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_text(text: str) -> Union[date, str]:
+    """Parse stripped date text, or return it unchanged; resumes repeat dates heavily"""
+    for pattern, fmt in _DATE_DISPATCH:
+        if pattern.fullmatch(text):
+            try:
+                return datetime.strptime(text, fmt).date()
+            except ValueError:
+                # Right shape, impossible value (e.g. month 13)
+                break
+    # If parsing fails, keep as string
+    return text
+
 
 class ContactInfoSchema(BaseModel):
     """Contact information section"""
@@ -31,18 +72,20 @@ class ContactInfoSchema(BaseModel):
         description="Other social media profiles (platform -> URL)"
     )
 
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
-        if v and not re.match(r'^[^@]+@[^@]+\.[^@]+$', v):
+        if v and not _EMAIL_RE.match(v):
             raise ValueError('Invalid email format')
         return v
 
-    @validator('phone')
+    @field_validator('phone')
+    @classmethod
     def validate_phone(cls, v):
         if v:
             # Remove common phone formatting characters for validation
-            cleaned = re.sub(r'[\s\-\(\)\+\.]', '', v)
-            if not re.match(r'^\d{7,15}$', cleaned):
+            cleaned = _PHONE_CLEAN_RE.sub('', v)
+            if not _PHONE_DIGITS_RE.match(cleaned):
                 raise ValueError('Invalid phone format')
         return v
 
@@ -58,30 +101,37 @@ class SummarySchema(BaseModel):
     )
 
 
+def _coerce_date_value(v: Any) -> Any:
+    """Parse date text in a known format; anything else passes through"""
+    if isinstance(v, str):
+        stripped = v.strip()
+        if stripped:
+            # Try to parse common date formats
+            return _parse_date_text(stripped)
+    return v
+
+
+# Date or raw date text. Checked left to right rather than in smart mode, which
+# tries every member strictly then laxly; text first keeps the smart-mode result
+# (str stays str, date stays date) with at most two checks
+DateOrText = Annotated[Union[str, date], Field(union_mode='left_to_right')]
+
+# DateOrText parsed by a validator attached to the type itself so pydantic-core
+# calls it directly instead of through a model field_validator
+DateValue = Annotated[Optional[DateOrText], BeforeValidator(_coerce_date_value)]
+
+
 class DateRangeSchema(BaseModel):
     """Flexible date range representation"""
 
-    start_date: Optional[Union[date, str]] = Field(None, description="Start date (parsed or raw string)")
-    end_date: Optional[Union[date, str]] = Field(None, description="End date (parsed or raw string)")
+    # Leaf entry, never mutated after validation; unknown keys are rejected
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    start_date: DateValue = Field(None, description="Start date (parsed or raw string)")
+    end_date: DateValue = Field(None, description="End date (parsed or raw string)")
     is_current: bool = Field(False, description="Whether this position/education is current")
     raw_date_text: Optional[str] = Field(None, description="Original date text as extracted", max_length=200)
 
-    @validator('start_date', 'end_date', pre=True)
-    def parse_dates(cls, v):
-        if isinstance(v, str) and v.strip():
-            # Try to parse common date formats
-            try:
-                for fmt in ['%Y-%m-%d', '%Y-%m', '%Y', '%m/%Y', '%m/%d/%Y']:
-                    try:
-                        return datetime.strptime(v.strip(), fmt).date()
-                    except ValueError:
-                        continue
-                # If parsing fails, keep as string
-                return v.strip()
-            except:
-                return v
-        return v
-
 
 class ExperienceEntrySchema(BaseModel):
     """Single work experience entry"""
@@ -146,6 +196,9 @@ class SkillCategoryEnum(str, Enum):
 class SkillEntrySchema(BaseModel):
     """Individual skill with metadata"""
 
+    # Leaf entry, never mutated after validation; unknown keys are rejected
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str = Field(..., description="Skill name as extracted", max_length=100)
     category: Optional[SkillCategoryEnum] = Field(None, description="Categorized skill type")
     proficiency_level: Optional[str] = Field(None, description="Proficiency level if mentioned", max_length=50)
@@ -163,6 +216,9 @@ class SkillEntrySchema(BaseModel):
 class ProjectEntrySchema(BaseModel):
     """Project or portfolio entry"""
 
+    # Leaf entry, never mutated after validation; unknown keys are rejected
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str = Field(..., description="Project name", max_length=200)
     description: Optional[str] = Field(None, description="Project description", max_length=2000)
     url: Optional[str] = Field(None, description="Project URL (GitHub, demo, etc.)", max_length=500)
@@ -182,14 +238,17 @@ class ProjectEntrySchema(BaseModel):
 class AchievementEntrySchema(BaseModel):
     """Achievement, award, or certification entry"""
 
+    # Leaf entry, never mutated after validation; unknown keys are rejected
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     title: str = Field(..., description="Achievement title", max_length=200)
     organization: Optional[str] = Field(None, description="Issuing organization", max_length=200)
-    date_received: Optional[Union[date, str]] = Field(None, description="Date received")
+    date_received: Optional[DateOrText] = Field(None, description="Date received")
     description: Optional[str] = Field(None, description="Achievement description", max_length=1000)
 
     # Type categorization
     type: Optional[str] = Field(None, description="Type: certification, award, publication, etc.", max_length=50)
-    expiration_date: Optional[Union[date, str]] = Field(None, description="Expiration date for certifications")
+    expiration_date: Optional[DateOrText] = Field(None, description="Expiration date for certifications")
     credential_id: Optional[str] = Field(None, description="Credential ID if applicable", max_length=100)
     verification_url: Optional[str] = Field(None, description="Verification URL", max_length=500)
 
@@ -203,7 +262,10 @@ class ExtractionMetadataSchema(BaseModel):
     confidence_score: float = Field(0.0, description="Overall extraction confidence (0.0-1.0)")
 
     # File information
-    source_file_hash: Optional[str] = Field(None, description="SHA-256 hash of source file")
+    source_file_hash: Optional[str] = Field(None, description="Hex digest of source file")
+    source_file_hash_algo: Optional[Literal['blake3', 'sha256']] = Field(
+        None, description="Algorithm that produced source_file_hash"
+    )
     file_size_bytes: Optional[int] = Field(None, description="Source file size in bytes")
     file_type: Optional[str] = Field(None, description="Detected file type")
 
@@ -279,38 +341,37 @@ class ProfileJSONSchema(BaseModel):
     @model_validator(mode='after')
     def privacy_compliance_check(self):
         """Ensure no derived PII beyond resume content"""
-
-        # Check that we don't have any computed demographic information
-        prohibited_fields = ['age', 'gender', 'race', 'nationality', 'marital_status']
-
-        def check_dict_for_prohibited(d: dict, path: str = ""):
-            for key, value in d.items():
-                full_path = f"{path}.{key}" if path else key
-                if key.lower() in prohibited_fields:
-                    raise ValueError(f"Prohibited derived PII field detected: {full_path}")
+        if not self.additional_sections:
+            return self
+
+        # Check additional_sections for computed demographic information,
+        # walking nested dicts with an explicit stack
+        stack = [("additional_sections", self.additional_sections)]
+        while stack:
+            path, section = stack.pop()
+            for key, value in section.items():
+                if key.lower() in _PROHIBITED_DERIVED_FIELDS:
+                    raise ValueError(f"Prohibited derived PII field detected: {path}.{key}")
                 if isinstance(value, dict):
-                    check_dict_for_prohibited(value, full_path)
-
-        # Check additional_sections for prohibited content
-        additional_sections = self.additional_sections or {}
-        if additional_sections:
-            check_dict_for_prohibited(additional_sections, "additional_sections")
+                    stack.append((f"{path}.{key}", value))
 
         return self
 
     # Schema validation
-    @validator('schema_version')
+    @field_validator('schema_version')
+    @classmethod
     def validate_schema_version(cls, v):
         """Ensure schema version follows semver format"""
-        if not re.match(r'^\d+\.\d+\.\d+$', v):
+        if not _SEMVER_RE.match(v):
             raise ValueError('Schema version must follow semantic versioning (x.y.z)')
         return v
 
-    @validator('contact')
+    @field_validator('contact')
+    @classmethod
     def validate_contact_privacy(cls, v):
         """Ensure contact info doesn't contain inferred data"""
-        if v and hasattr(v, 'dict'):
-            contact_dict = v.dict() if hasattr(v, 'dict') else v
+        if v and hasattr(v, 'model_dump'):
+            contact_dict = v.model_dump()
             # Only allow data that would be directly on a resume
             allowed_contact_fields = {
                 'full_name', 'email', 'phone', 'location', 'website',
@@ -321,12 +382,41 @@ class ProfileJSONSchema(BaseModel):
                     raise ValueError(f"Contact field '{field}' not allowed - may contain inferred PII")
         return v
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat() if v else None
-        }
-        schema_extra = {
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ProfileJSONSchema":
+        """
+        Rebuild a profile from data this service already validated (e.g. a
+        stored or decrypted profile) with model_construct, skipping every
+        validator. Values are taken as-is, not coerced. Parser output and any
+        external input must go through normal validation instead.
+        """
+        data = dict(data)
+
+        for field, section_schema in _TRUSTED_SECTION_SCHEMAS:
+            section = data.get(field)
+            if isinstance(section, dict):
+                data[field] = _construct_trusted(section_schema, section)
+
+        for field, entry_schema in _TRUSTED_ENTRY_SCHEMAS:
+            entries = data.get(field)
+            if entries:
+                data[field] = [
+                    _construct_trusted(entry_schema, entry) if isinstance(entry, dict) else entry
+                    for entry in entries
+                ]
+
+        return cls.model_construct(**data)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to UTF-8 JSON through pydantic-core's native serializer,
+        ready to hand to EncryptionService.encrypt_data
+        """
+        return self.model_dump_json().encode('utf-8')
+
+    # datetime and date serialize to ISO 8601 natively in pydantic v2
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "schema_version": "1.0.0",
                 "generated_at": "2025-09-24T06:15:00.000Z",
@@ -373,6 +463,30 @@ class ProfileJSONSchema(BaseModel):
                 }
             }
         }
+    )
+
+
+# Nested schemas rebuilt by ProfileJSONSchema.from_trusted
+_TRUSTED_SECTION_SCHEMAS = (
+    ('contact', ContactInfoSchema),
+    ('summary', SummarySchema),
+    ('metadata', ExtractionMetadataSchema),
+)
+_TRUSTED_ENTRY_SCHEMAS = (
+    ('experience', ExperienceEntrySchema),
+    ('education', EducationEntrySchema),
+    ('skills', SkillEntrySchema),
+    ('projects', ProjectEntrySchema),
+    ('achievements', AchievementEntrySchema),
+)
+
+
+def _construct_trusted(schema: type, data: Dict[str, Any]) -> BaseModel:
+    """model_construct a nested schema, including an entry's date range"""
+    dates = data.get('dates')
+    if isinstance(dates, dict):
+        data = {**data, 'dates': DateRangeSchema.model_construct(**dates)}
+    return schema.model_construct(**data)
 
 
 # Schema versioning and compatibility utilities
@@ -382,10 +496,22 @@ def get_schema_version() -> str:
     return PROFILE_SCHEMA_VERSION
 
 
+@functools.cache
+def get_profile_json_schema() -> Dict[str, Any]:
+    """
+    JSON Schema for ProfileJSONSchema, example included. pydantic regenerates
+    it on every model_json_schema() call, so it is built once and shared;
+    callers must not mutate it.
+    """
+    return ProfileJSONSchema.model_json_schema()
+
+
+@functools.lru_cache(maxsize=64)
 def is_schema_compatible(profile_version: str, current_version: str = PROFILE_SCHEMA_VERSION) -> bool:
     """
     Check if profile schema version is compatible with current version
-    Uses semantic versioning compatibility rules
+    Uses semantic versioning compatibility rules; memoized, as only a
+    handful of distinct versions are ever seen
     """
     try:
         profile_parts = [int(x) for x in profile_version.split('.')]
@@ -21,8 +21,14 @@ class UploadResponse(BaseModel):
     upload_timestamp: datetime = Field(..., description="Upload completion time")
     status: str = Field(default="uploaded", description="Upload status")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "UploadResponse":
+        """
+        Build a response from values the upload endpoint produced itself
+        (IDs, checksum, size, timestamp) with model_construct, skipping
+        validation. Values are taken as-is, not coerced.
+        """
+        return cls.model_construct(**fields)
 
 
 class ErrorResponse(BaseModel):
@@ -53,9 +59,6 @@ class ParsingJob(BaseModel):
     job_id: Optional[str] = Field(None, description="Optional job ID for tracking")
     force_reparse: bool = Field(False, description="Force re-parsing even if already processed")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class ParsingJobResponse(BaseModel):
     """Response model for parsing job"""
@@ -69,8 +72,15 @@ class ParsingJobResponse(BaseModel):
     processing_time_ms: Optional[int] = Field(None, description="Processing time in milliseconds")
     warnings: Optional[List[str]] = Field(None, description="Non-fatal warnings during processing")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "ParsingJobResponse":
+        """
+        Build a response from values the parser service produced itself
+        (job ID, status, timestamps, the extractor's result dict) with
+        model_construct, skipping validation. Values are taken as-is, not
+        coerced.
+        """
+        return cls.model_construct(**fields)
 
 
 # Import the comprehensive ProfileJSON schema
@@ -3,28 +3,101 @@ DOCX Resume Extractor with Deterministic Rules
 Implements section detection and content extraction for DOCX files
 """
 
+import functools
+import importlib.util
 import re
+import zipfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
-from dateutil import parser as date_parser
 import structlog
 import io
 
-try:
-    from docx import Document
-    from docx.document import Document as DocumentType
-    from docx.text.paragraph import Paragraph
-except ImportError:
-    Document = None
-    DocumentType = None
-    Paragraph = None
-
 from app.services.file_service import FileService
 
+if TYPE_CHECKING:
+    from docx.document import Document as DocumentType
+
 logger = structlog.get_logger()
 
 
+# python-docx and lxml are imported on first DOCX extraction rather than at
+# startup, so workers that never see a DOCX never load them
+
+
+@functools.cache
+def _docx_document_factory():
+    """python-docx's Document, imported on first use"""
+    from docx import Document
+    return Document
+
+
+@functools.cache
+def _lxml_etree():
+    """
+    lxml.etree, imported on first use. lxml ships as a python-docx
+    dependency; without it (None) every document goes through python-docx
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        return None
+    return etree
+
+
+# WordprocessingML names used when streaming word/document.xml directly
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = f'{_W_NS}body'
+_W_P = f'{_W_NS}p'
+_W_R = f'{_W_NS}r'
+_W_HYPERLINK = f'{_W_NS}hyperlink'
+_W_T = f'{_W_NS}t'
+_W_BR = f'{_W_NS}br'
+_W_TYPE = f'{_W_NS}type'
+_W_VAL = f'{_W_NS}val'
+_W_BOLD_PATH = f'{_W_NS}r/{_W_NS}rPr/{_W_NS}b'
+# Run content that python-docx renders as text, besides w:t and w:br (only
+# text-wrapping breaks count; page and column breaks render as '')
+_W_RUN_CHARS = {
+    f'{_W_NS}tab': '\t',
+    f'{_W_NS}ptab': '\t',
+    f'{_W_NS}cr': '\n',
+    f'{_W_NS}noBreakHyphen': '-',
+}
+_W_FALSE_VALUES = frozenset({'0', 'false', 'off'})
+
+# Paragraphs longer than this are never treated as section headers
+MAX_HEADER_LENGTH = 50
+
+
+def _xml_paragraph_text(paragraph) -> str:
+    """
+    Text of a w:p element as python-docx's Paragraph.text gives it: only runs
+    that are direct children of the paragraph or of a w:hyperlink, so text
+    boxes anchored in runs, tracked insertions etc. are left out
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            runs = (child,)
+        elif child.tag == _W_HYPERLINK:
+            runs = child.iterchildren(_W_R)
+        else:
+            continue
+
+        for run in runs:
+            for node in run:
+                tag = node.tag
+                if tag == _W_T:
+                    parts.append(node.text or '')
+                elif tag == _W_BR:
+                    if node.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                elif tag in _W_RUN_CHARS:
+                    parts.append(_W_RUN_CHARS[tag])
+    return ''.join(parts)
+
+
 class DOCXExtractor:
     """
     DOCX resume parser using deterministic rules for section detection
@@ -62,11 +135,26 @@ class DOCXExtractor:
         ]
     }
 
+    # One case-insensitive regex per section, in SECTION_PATTERNS order;
+    # compiled once at class load
+    _COMPILED_SECTION_PATTERNS = {
+        section_name: re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+        for section_name, patterns in SECTION_PATTERNS.items()
+    }
+
     # Email and phone patterns
     EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
     PHONE_PATTERN = re.compile(r'[\+]?[1-9]?[\d\s\-\(\)\.]{8,15}\d')
     URL_PATTERN = re.compile(r'https?://[^\s]+|www\.[^\s]+')
 
+    # The three contact patterns as one alternation, so text is scanned once;
+    # match.lastgroup names the kind. Where two could start at the same
+    # position, the earlier one in this order wins
+    CONTACT_PATTERN = re.compile('|'.join(
+        f'(?P<{kind}>{pattern.pattern})'
+        for kind, pattern in (('email', EMAIL_PATTERN), ('url', URL_PATTERN), ('phone', PHONE_PATTERN))
+    ))
+
     # Date patterns for experience
     DATE_PATTERNS = [
         r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{4}\b',
@@ -76,7 +164,8 @@ class DOCXExtractor:
     ]
 
     def __init__(self):
-        if Document is None:
+        # Checked without importing; the import itself is deferred
+        if importlib.util.find_spec("docx") is None:
             raise ImportError("python-docx is required for DOCX extraction")
 
     async def extract(self, file_path: Path, job_id: str) -> Dict[str, Any]:
@@ -100,17 +189,18 @@ class DOCXExtractor:
             # Read and decrypt file content
             file_content = FileService.read_encrypted_file(str(file_path))
 
-            # Load DOCX document from decrypted content
-            document = Document(io.BytesIO(file_content))
+            # Stream paragraphs from the document XML; python-docx handles
+            # packages without a standard word/document.xml part
+            paragraphs = self._iter_xml_paragraphs(file_content)
+            if paragraphs is None:
+                document = _docx_document_factory()(io.BytesIO(file_content))
+                paragraphs = self._iter_docx_paragraphs(document)
 
-            # Extract all paragraphs with their styles
-            paragraphs = self._extract_paragraphs(document)
-
-            # Detect sections
-            sections = self._detect_sections(paragraphs, job_id)
+            # Detect sections and contact details in one pass over paragraphs
+            sections, contact = self._scan_document(paragraphs, job_id)
 
             # Extract content from each section
-            extracted_data = await self._extract_content(sections, paragraphs, job_id)
+            extracted_data = await self._extract_content(sections, contact, job_id)
 
             # Normalize and validate
             result = self._normalize_output(extracted_data, job_id)
@@ -134,89 +224,112 @@ class DOCXExtractor:
             )
             raise
 
-    def _extract_paragraphs(self, document: DocumentType) -> List[Dict[str, Any]]:
-        """Extract all paragraphs with metadata"""
-        paragraphs = []
-
-        for i, paragraph in enumerate(document.paragraphs):
-            text = paragraph.text.strip()
-            if not text:
-                continue
-
-            # Detect if paragraph is likely a header
-            is_header = self._is_likely_header(paragraph)
-
-            paragraphs.append({
-                'index': i,
-                'text': text,
-                'is_header': is_header,
-                'style': paragraph.style.name if paragraph.style else None,
-                'runs': [run.text for run in paragraph.runs],
-                'is_bold': any(run.bold for run in paragraph.runs),
-                'font_size': self._get_font_size(paragraph)
-            })
-
-        return paragraphs
-
-    def _is_likely_header(self, paragraph: Paragraph) -> bool:
-        """Determine if paragraph is likely a section header"""
-        # Check if text is short and might be a header
-        text = paragraph.text.strip()
-        if len(text) > 50:
-            return False
-
-        # Check formatting indicators
-        has_bold = any(run.bold for run in paragraph.runs)
-        is_uppercase = text.isupper()
+    def _iter_xml_paragraphs(self, file_content: bytes) -> Optional[Iterator[Tuple[str, bool]]]:
+        """
+        Stream body paragraphs straight from word/document.xml
 
-        # Check if matches section patterns
-        matches_pattern = any(
-            any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
-            for patterns in self.SECTION_PATTERNS.values()
-        )
+        Returns:
+            Iterator of (stripped text, has bold run) per top-level body
+            paragraph, as python-docx's document.paragraphs would give, or
+            None if lxml or the standard document part is unavailable
+        """
+        etree = _lxml_etree()
+        if etree is None:
+            return None
 
-        return (has_bold or is_uppercase) and matches_pattern
+        archive = zipfile.ZipFile(io.BytesIO(file_content))
+        try:
+            xml_file = archive.open('word/document.xml')
+        except KeyError:
+            archive.close()
+            return None
 
-    def _get_font_size(self, paragraph: Paragraph) -> Optional[int]:
-        """Get font size of paragraph if available"""
-        for run in paragraph.runs:
-            if run.font.size:
-                return int(run.font.size.pt)
-        return None
+        def paragraphs() -> Iterator[Tuple[str, bool]]:
+            with archive, xml_file:
+                # Uploads are untrusted: no entity expansion, no network fetches
+                parser_events = etree.iterparse(
+                    xml_file, events=('end',), tag=_W_P,
+                    resolve_entities=False, no_network=True,
+                )
+                for _, elem in parser_events:
+                    parent = elem.getparent()
+                    # Paragraphs inside tables, text boxes etc. are skipped
+                    if parent is None or parent.tag != _W_BODY:
+                        continue
+
+                    text = _xml_paragraph_text(elem).strip()
+                    is_bold = 0 < len(text) <= MAX_HEADER_LENGTH and any(
+                        b.get(_W_VAL, 'true') not in _W_FALSE_VALUES
+                        for b in elem.iterfind(_W_BOLD_PATH)
+                    )
+                    yield text, is_bold
+
+                    # Keep memory flat: drop this paragraph and everything before it
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+        return paragraphs()
+
+    @staticmethod
+    def _iter_docx_paragraphs(document: "DocumentType") -> Iterator[Tuple[str, bool]]:
+        """(stripped text, has bold run) per paragraph, via python-docx"""
+        for paragraph in document.paragraphs:
+            text = paragraph.text.strip()
+            is_bold = 0 < len(text) <= MAX_HEADER_LENGTH and any(
+                run.bold for run in paragraph.runs
+            )
+            yield text, is_bold
 
-    def _detect_sections(self, paragraphs: List[Dict], job_id: str) -> Dict[str, List[int]]:
+    def _scan_document(self, paragraphs: Iterable[Tuple[str, bool]],
+                       job_id: str) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
         """
-        Detect section boundaries in the document
+        Single pass over the document's paragraphs
+
+        Args:
+            paragraphs: (stripped text, has bold run) per paragraph
+            job_id: Job ID for logging
 
         Returns:
-            Dictionary mapping section names to paragraph indices
+            Tuple of (section name -> paragraph texts under that header,
+            contact information found anywhere in the document)
         """
         sections = {}
-        current_section = None
+        current_lines = None
+        email = None
+        phone = None
+        urls = []
+
+        for text, is_bold in paragraphs:
+            if not text:
+                continue
 
-        for para in paragraphs:
-            text = para['text'].lower()
+            # Contact details: first email and phone, up to 3 URLs
+            if email is None or phone is None or len(urls) < 3:
+                for match in self.CONTACT_PATTERN.finditer(text):
+                    kind = match.lastgroup
+                    if kind == 'email':
+                        if email is None:
+                            email = match.group()
+                    elif kind == 'url':
+                        if len(urls) < 3:
+                            urls.append(match.group())
+                    elif phone is None:
+                        phone = match.group().strip()
 
             # Check for section headers
-            detected_section = None
-            for section_name, patterns in self.SECTION_PATTERNS.items():
-                if any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns):
-                    detected_section = section_name
-                    break
-
-            if detected_section and para['is_header']:
-                current_section = detected_section
-                if current_section not in sections:
-                    sections[current_section] = []
+            detected_section = self._match_section(text)
+            if detected_section and self._is_likely_header(text, is_bold):
+                current_lines = sections.setdefault(detected_section, [])
                 logger.debug(
                     "Section detected",
                     job_id=job_id,
-                    section=current_section,
-                    header_text=para['text'][:50]
+                    section=detected_section,
+                    header_text=text[:50]
                 )
-            elif current_section:
+            elif current_lines is not None:
                 # Add content to current section
-                sections[current_section].append(para['index'])
+                current_lines.append(text)
 
         logger.info(
             "Section detection completed",
@@ -224,12 +337,35 @@ class DOCXExtractor:
             sections_found=list(sections.keys())
         )
 
-        return sections
+        contact = {}
+        if email:
+            contact['email'] = email
+        if phone:
+            contact['phone'] = phone
+        if urls:
+            contact['urls'] = urls
+
+        return sections, contact
+
+    def _match_section(self, text: str) -> Optional[str]:
+        """Name of the first section whose header patterns match text"""
+        for section_name, section_re in self._COMPILED_SECTION_PATTERNS.items():
+            if section_re.search(text):
+                return section_name
+        return None
 
-    async def _extract_content(self, sections: Dict, paragraphs: List[Dict], job_id: str) -> Dict[str, Any]:
+    def _is_likely_header(self, text: str, is_bold: bool) -> bool:
+        """Determine if a paragraph already matching a section pattern is a header"""
+        if len(text) > MAX_HEADER_LENGTH:
+            return False
+
+        return is_bold or text.isupper()
+
+    async def _extract_content(self, sections: Dict[str, List[str]], contact: Dict[str, Any],
+                               job_id: str) -> Dict[str, Any]:
         """Extract and structure content from detected sections"""
         extracted = {
-            'contact': {},
+            'contact': contact,
             'summary': '',
             'experience': [],
             'education': [],
@@ -239,15 +375,9 @@ class DOCXExtractor:
             'warnings': []
         }
 
-        # Extract contact information from entire document first
-        all_text = ' '.join(p['text'] for p in paragraphs)
-        extracted['contact'] = self._extract_contact_info(all_text)
-
         # Process each section
-        for section_name, para_indices in sections.items():
-            # Filter out invalid indices
-            valid_indices = [i for i in para_indices if 0 <= i < len(paragraphs)]
-            section_text = '\n'.join(paragraphs[i]['text'] for i in valid_indices)
+        for section_name, lines in sections.items():
+            section_text = '\n'.join(lines)
 
             if section_name == 'summary':
                 extracted['summary'] = self._clean_text(section_text)
@@ -269,27 +399,6 @@ class DOCXExtractor:
 
         return extracted
 
-    def _extract_contact_info(self, text: str) -> Dict[str, Any]:
-        """Extract contact information from text"""
-        contact = {}
-
-        # Extract email
-        emails = self.EMAIL_PATTERN.findall(text)
-        if emails:
-            contact['email'] = emails[0]
-
-        # Extract phone
-        phones = self.PHONE_PATTERN.findall(text)
-        if phones:
-            contact['phone'] = phones[0].strip()
-
-        # Extract URLs
-        urls = self.URL_PATTERN.findall(text)
-        if urls:
-            contact['urls'] = urls[:3]  # Limit to 3 URLs
-
-        return contact
-
     def _extract_experience(self, text: str, job_id: str) -> List[Dict[str, Any]]:
         """Extract work experience entries"""
         experience = []
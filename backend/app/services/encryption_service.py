@@ -5,16 +5,27 @@ Provides encryption at rest for original files and ProfileJSON data
 
 import os
 import hashlib
+import functools
 import secrets
+import time
 from pathlib import Path
-from typing import BinaryIO, Iterator, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Iterator, List, Optional, Sequence, Tuple, Union
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import structlog
 from datetime import datetime
 import base64
 
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
 from app.core.config import settings
 
 logger = structlog.get_logger()
@@ -22,6 +33,60 @@ logger = structlog.get_logger()
 # Chunk size for streaming encryption (1MB)
 CHUNK_SIZE = 1024 * 1024
 
+# Encrypted file layout: FILE_MAGIC, a random base nonce, then one frame per
+# plaintext chunk, each a 4-byte big-endian ciphertext length followed by the
+# AES-GCM ciphertext (tag included). Files without the magic are legacy Fernet.
+FILE_MAGIC = b"SCOUTv1"
+NONCE_SIZE = 12
+FRAME_LENGTH_SIZE = 4
+FILE_ALGORITHM = "AES-256-GCM"
+
+# encrypt_data output: DATA_MAGIC, a random nonce, then the AES-GCM
+# ciphertext. Data without the magic is a legacy Fernet token.
+DATA_MAGIC = b"SCOUTd1"
+
+
+# Plaintext digest recorded while encrypting; BLAKE3 when installed
+SOURCE_HASH_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
+
+def _new_source_hasher():
+    """Hash object for SOURCE_HASH_ALGORITHM"""
+    return blake3() if blake3 is not None else hashlib.sha256()
+
+
+# PBKDF2 parameters; changing either makes existing files undecryptable
+KDF_SALT = b'scout_salt_deterministic_dev'  # Fixed salt for dev consistency
+KDF_ITERATIONS = 100000
+
+
+@functools.lru_cache(maxsize=4)
+def _derive_master_key(encryption_key: str) -> bytes:
+    """
+    PBKDF2-HMAC-SHA256 derivation of the 32-byte master key
+
+    Salt and iterations are fixed, so the result depends only on the
+    configured key; cached so each EncryptionService after the first skips
+    the ~100 ms of KDF work. Kept in process memory only, never on disk.
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=KDF_SALT,
+        iterations=KDF_ITERATIONS,
+    )
+    return kdf.derive(encryption_key.encode('utf-8'))
+
+
+def _derive_subkey(master_key: bytes, info: bytes) -> bytes:
+    """HKDF-SHA256 subkey of the master key for one purpose"""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=info,
+    ).derive(master_key)
+
 
 class EncryptionError(Exception):
     """Custom exception for encryption-related errors"""
@@ -31,12 +96,14 @@ class EncryptionError(Exception):
 class EncryptionService:
     """
     Service for encrypting and decrypting artifacts at rest
-    Uses Fernet symmetric encryption with streaming support
+    Uses AES-256-GCM, chunked for files; reads legacy Fernet data
     """
 
     def __init__(self):
         self._key = None
         self._fernet = None
+        self._aesgcm = None
+        self._data_aesgcm = None
         self._initialize_encryption()
 
     def _initialize_encryption(self) -> None:
@@ -52,24 +119,18 @@ class EncryptionService:
                 # Generate a deterministic key for development
                 encryption_key = "dev_key_scout_local_not_for_prod_use"
 
-            # Derive a proper Fernet key from the provided key
-            key_bytes = encryption_key.encode('utf-8')
-            salt = b'scout_salt_deterministic_dev'  # Fixed salt for dev consistency
+            self._key = _derive_master_key(encryption_key)
+            # Fernet only decrypts data written before the AES-GCM formats
+            self._fernet = Fernet(base64.urlsafe_b64encode(self._key))
 
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-
-            derived_key = base64.urlsafe_b64encode(kdf.derive(key_bytes))
-            self._fernet = Fernet(derived_key)
+            # Files and raw data each get their own key, separated by HKDF
+            self._aesgcm = AESGCM(_derive_subkey(self._key, b'scout_file_encryption_v1'))
+            self._data_aesgcm = AESGCM(_derive_subkey(self._key, b'scout_data_encryption_v1'))
 
             logger.info(
                 "Encryption service initialized",
                 key_length=len(encryption_key),
-                algorithm="Fernet_PBKDF2_SHA256"
+                algorithm=f"{FILE_ALGORITHM}_PBKDF2_SHA256"
             )
 
         except Exception as e:
@@ -100,7 +161,7 @@ class EncryptionService:
         # Ensure target directory exists
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         original_size = source_path.stat().st_size
 
         logger.info(
@@ -111,20 +172,23 @@ class EncryptionService:
         )
 
         try:
+            # Hash the plaintext as it streams through rather than re-reading it
+            source_hash = _new_source_hasher()
             with open(source_path, 'rb') as source_file:
                 with open(target_path, 'wb') as target_file:
-                    encrypted_size = self._encrypt_stream(source_file, target_file)
+                    encrypted_size = self._encrypt_stream(source_file, target_file, source_hash)
 
             # Calculate processing time
-            processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             metadata = {
                 'encrypted_at': datetime.now().isoformat(),
                 'original_size': original_size,
                 'encrypted_size': encrypted_size,
                 'processing_time_ms': processing_time_ms,
-                'algorithm': 'Fernet',
-                'source_hash': self._calculate_file_hash(source_path)
+                'algorithm': FILE_ALGORITHM,
+                'source_hash': source_hash.hexdigest(),
+                'source_hash_algorithm': SOURCE_HASH_ALGORITHM
             }
 
             logger.info(
@@ -152,6 +216,30 @@ class EncryptionService:
             )
             raise EncryptionError(f"Encryption failed: {e}")
 
+    def encrypt_files(
+        self,
+        pairs: Sequence[Tuple[Union[str, Path], Union[str, Path]]],
+        workers: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Encrypt several files concurrently
+
+        OpenSSL releases the GIL while hashing and encrypting, and the cipher
+        objects are immutable once built, so threads scale with cores.
+
+        Args:
+            pairs: (source_path, target_path) pairs
+            workers: Thread count, defaults to the CPU count
+
+        Returns:
+            List[dict]: Encryption metadata for each pair, in input order
+        """
+        if len(pairs) <= 1:
+            return [self.encrypt_file(source, target) for source, target in pairs]
+
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(lambda pair: self.encrypt_file(*pair), pairs))
+
     def decrypt_file(self, source_path: Union[str, Path], target_path: Union[str, Path]) -> dict:
         """
         Decrypt a file and write to target location with streaming
@@ -172,7 +260,7 @@ class EncryptionService:
         # Ensure target directory exists
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         encrypted_size = source_path.stat().st_size
 
         logger.info(
@@ -185,17 +273,17 @@ class EncryptionService:
         try:
             with open(source_path, 'rb') as source_file:
                 with open(target_path, 'wb') as target_file:
-                    decrypted_size = self._decrypt_stream(source_file, target_file)
+                    decrypted_size, algorithm = self._decrypt_stream(source_file, target_file)
 
             # Calculate processing time
-            processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             metadata = {
                 'decrypted_at': datetime.now().isoformat(),
                 'encrypted_size': encrypted_size,
                 'decrypted_size': decrypted_size,
                 'processing_time_ms': processing_time_ms,
-                'algorithm': 'Fernet'
+                'algorithm': algorithm
             }
 
             logger.info(
@@ -231,10 +319,11 @@ class EncryptionService:
             data: Raw bytes to encrypt
 
         Returns:
-            bytes: Encrypted data
+            bytes: DATA_MAGIC, nonce and ciphertext (plaintext + 16-byte tag)
         """
         try:
-            return self._fernet.encrypt(data)
+            nonce = secrets.token_bytes(NONCE_SIZE)
+            return DATA_MAGIC + nonce + self._data_aesgcm.encrypt(nonce, data, DATA_MAGIC)
         except Exception as e:
             logger.error(
                 "Data encryption failed",
@@ -254,7 +343,12 @@ class EncryptionService:
             bytes: Decrypted data
         """
         try:
-            return self._fernet.decrypt(encrypted_data)
+            if not encrypted_data.startswith(DATA_MAGIC):
+                return self._fernet.decrypt(encrypted_data)
+
+            header_size = len(DATA_MAGIC) + NONCE_SIZE
+            nonce = encrypted_data[len(DATA_MAGIC):header_size]
+            return self._data_aesgcm.decrypt(nonce, encrypted_data[header_size:], DATA_MAGIC)
         except Exception as e:
             logger.error(
                 "Data decryption failed",
@@ -263,55 +357,116 @@ class EncryptionService:
             )
             raise EncryptionError("Data decryption failed - invalid data or key mismatch")
 
-    def _encrypt_stream(self, source: BinaryIO, target: BinaryIO) -> int:
+    def _encrypt_stream(
+        self, source: BinaryIO, target: BinaryIO, hasher: Optional[Any] = None
+    ) -> int:
         """
         Stream encrypt from source to target file
 
+        Each chunk is sealed independently with AES-GCM under a nonce derived
+        from the file's base nonce and the chunk index. The index and a
+        final-chunk flag are bound in as associated data, so frames cannot be
+        reordered, dropped or truncated without failing authentication.
+
+        Args:
+            source: Plaintext input
+            target: Encrypted output
+            hasher: Optional hash object updated with each plaintext chunk
+
         Returns:
             int: Total bytes written to target
         """
-        total_written = 0
+        base_nonce = secrets.token_bytes(NONCE_SIZE)
+        target.write(FILE_MAGIC + base_nonce)
+        total_written = len(FILE_MAGIC) + NONCE_SIZE
 
-        while True:
-            chunk = source.read(CHUNK_SIZE)
-            if not chunk:
-                break
+        # Two reusable buffers, filled alternately with readinto, so the loop
+        # allocates no plaintext bytes objects
+        current = memoryview(bytearray(CHUNK_SIZE))
+        ahead = memoryview(bytearray(CHUNK_SIZE))
 
-            encrypted_chunk = self._fernet.encrypt(chunk)
+        index = 0
+        length = source.readinto(current)
+        while True:
+            # Read ahead one chunk to know whether this one is the last
+            next_length = source.readinto(ahead) if length else 0
+            is_final = not next_length
+            chunk = current[:length]
+            if hasher is not None:
+                hasher.update(chunk)
+
+            encrypted_chunk = self._aesgcm.encrypt(
+                _chunk_nonce(base_nonce, index), chunk, _chunk_aad(index, is_final)
+            )
+            target.write(len(encrypted_chunk).to_bytes(FRAME_LENGTH_SIZE, 'big'))
             target.write(encrypted_chunk)
-            total_written += len(encrypted_chunk)
+            total_written += FRAME_LENGTH_SIZE + len(encrypted_chunk)
+
+            if is_final:
+                break
+            current, ahead = ahead, current
+            length = next_length
+            index += 1
 
         return total_written
 
-    def _decrypt_stream(self, source: BinaryIO, target: BinaryIO) -> int:
+    def _decrypt_stream(self, source: BinaryIO, target: BinaryIO) -> Tuple[int, str]:
         """
         Stream decrypt from source to target file
 
+        Memory use is bounded by one frame. Files written before the framed
+        format are decrypted whole as a single Fernet token.
+
         Returns:
-            int: Total bytes written to target
+            Tuple[int, str]: Total bytes written to target, algorithm used
         """
-        total_written = 0
-        buffer = b''
-
-        # Read entire encrypted file (Fernet doesn't support streaming)
-        # For large files, this could be optimized with chunked Fernet tokens
-        encrypted_data = source.read()
-        decrypted_data = self._fernet.decrypt(encrypted_data)
+        header = source.read(len(FILE_MAGIC))
+        if header != FILE_MAGIC:
+            decrypted_data = self._fernet.decrypt(header + source.read())
+            target.write(decrypted_data)
+            return len(decrypted_data), 'Fernet'
 
-        target.write(decrypted_data)
-        total_written = len(decrypted_data)
+        base_nonce = source.read(NONCE_SIZE)
+        if len(base_nonce) != NONCE_SIZE:
+            raise EncryptionError("Truncated encrypted file header")
 
-        return total_written
+        total_written = 0
+        index = 0
+        while True:
+            length_bytes = source.read(FRAME_LENGTH_SIZE)
+            if len(length_bytes) != FRAME_LENGTH_SIZE:
+                raise EncryptionError("Encrypted file ended before its final chunk")
+
+            frame_length = int.from_bytes(length_bytes, 'big')
+            if frame_length > CHUNK_SIZE + 16:
+                raise EncryptionError("Encrypted chunk exceeds maximum size")
+            encrypted_chunk = source.read(frame_length)
+            if len(encrypted_chunk) != frame_length:
+                raise EncryptionError("Encrypted file ended before its final chunk")
+
+            # A frame that only authenticates as final must end the file
+            nonce = _chunk_nonce(base_nonce, index)
+            try:
+                chunk = self._aesgcm.decrypt(nonce, encrypted_chunk, _chunk_aad(index, False))
+                is_final = False
+            except InvalidTag:
+                chunk = self._aesgcm.decrypt(nonce, encrypted_chunk, _chunk_aad(index, True))
+                is_final = True
+
+            target.write(chunk)
+            total_written += len(chunk)
+
+            if is_final:
+                if source.read(1):
+                    raise EncryptionError("Unexpected data after final encrypted chunk")
+                return total_written, FILE_ALGORITHM
+            index += 1
 
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA-256 hash of a file"""
-        hash_sha256 = hashlib.sha256()
-
+        # file_digest runs the read/update loop in C with a large buffer
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-
-        return hash_sha256.hexdigest()
+            return hashlib.file_digest(f, 'sha256').hexdigest()
 
     def verify_key_health(self) -> dict:
         """
@@ -331,7 +486,7 @@ class EncryptionService:
             result = {
                 'healthy': success,
                 'test_timestamp': datetime.now().isoformat(),
-                'algorithm': 'Fernet'
+                'algorithm': FILE_ALGORITHM
             }
 
             if success:
@@ -353,5 +508,18 @@ class EncryptionService:
             }
 
 
-# Global encryption service instance
-encryption_service = EncryptionService()
\ No newline at end of file
+def _chunk_nonce(base_nonce: bytes, index: int) -> bytes:
+    """Per-chunk nonce: the chunk index XORed into the last 4 nonce bytes"""
+    counter = int.from_bytes(base_nonce[-4:], 'big') ^ index
+    return base_nonce[:-4] + counter.to_bytes(4, 'big')
+
+
+def _chunk_aad(index: int, is_final: bool) -> bytes:
+    """Associated data binding a chunk to its position in the file"""
+    return index.to_bytes(4, 'big') + (b'\x01' if is_final else b'\x00')
+
+
+@functools.cache
+def get_encryption_service() -> EncryptionService:
+    """Global encryption service instance, created (and its key derived) on first use"""
+    return EncryptionService()
\ No newline at end of file
@@ -9,12 +9,34 @@ from datetime import datetime
 from pathlib import Path
 from typing import Tuple, Optional
 import structlog
+from fastapi import UploadFile
 
 from app.core.config import settings
-from app.services.encryption_service import encryption_service, EncryptionError
+from app.services.encryption_service import get_encryption_service, EncryptionError
 
 logger = structlog.get_logger()
 
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# MIME type per lowercase extension; which of these are accepted is
+# governed by settings.ALLOWED_EXTENSIONS
+MIME_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "doc": "application/msword",
+    "txt": "text/plain",
+}
+
+
+class FileSizeError(ValueError):
+    """Upload is empty or exceeds MAX_FILE_SIZE"""
+
+    def __init__(self, file_size: int):
+        super().__init__(f"Invalid file size: {file_size} bytes")
+        # Bytes read when the upload was rejected; a lower bound if too large
+        self.file_size = file_size
+
 
 class FileService:
     """Service for handling file operations"""
@@ -30,13 +52,20 @@ class FileService:
         return hashlib.sha256(file_content).hexdigest()
 
     @staticmethod
-    def validate_file_type(filename: str) -> bool:
-        """Validate file extension against allowed types"""
+    def classify_file(filename: str) -> Optional[str]:
+        """Return the MIME type of an allowed upload, or None if its type is not allowed"""
         if not filename:
-            return False
+            return None
 
-        extension = "." + filename.lower().split(".")[-1]
-        return extension in settings.allowed_extensions_list
+        extension = filename.rpartition(".")[2].lower()
+        if extension not in settings.allowed_extensions_list:
+            return None
+        return MIME_TYPES.get(extension, "application/octet-stream")
+
+    @staticmethod
+    def validate_file_type(filename: str) -> bool:
+        """Validate file extension against allowed types"""
+        return FileService.classify_file(filename) is not None
 
     @staticmethod
     def validate_file_size(file_size: int) -> bool:
@@ -46,12 +75,8 @@ class FileService:
     @staticmethod
     def get_mime_type(filename: str) -> str:
         """Get MIME type based on file extension"""
-        extension = filename.lower().split(".")[-1]
-        mime_types = {
-            "pdf": "application/pdf",
-            "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        }
-        return mime_types.get(extension, "application/octet-stream")
+        extension = filename.rpartition(".")[2].lower()
+        return MIME_TYPES.get(extension, "application/octet-stream")
 
     @staticmethod
     def create_storage_path(run_id: str, filename: str) -> Tuple[str, str]:
@@ -91,7 +116,6 @@ class FileService:
             # Create storage paths
             full_path, redacted_path = FileService.create_storage_path(run_id, filename)
             temp_path = full_path + ".tmp"
-            encrypted_path = full_path + ".enc"
 
             # Ensure directory exists
             Path(full_path).parent.mkdir(parents=True, exist_ok=True)
@@ -100,40 +124,7 @@ class FileService:
             with open(temp_path, "wb") as f:
                 f.write(file_content)
 
-            # Encrypt the file
-            try:
-                encryption_metadata = encryption_service.encrypt_file(temp_path, encrypted_path)
-
-                # Move encrypted file to final location
-                Path(encrypted_path).rename(full_path)
-
-                # Remove temporary file
-                Path(temp_path).unlink()
-
-                logger.info(
-                    "File stored and encrypted successfully",
-                    run_id=run_id,
-                    filename=filename,
-                    original_size=len(file_content),
-                    encrypted_size=encryption_metadata.get('encrypted_size'),
-                    encryption_time_ms=encryption_metadata.get('processing_time_ms')
-                )
-
-            except EncryptionError as e:
-                # Fallback: store unencrypted if encryption fails
-                logger.warning(
-                    "Encryption failed, storing unencrypted file",
-                    run_id=run_id,
-                    filename=filename,
-                    error="Encryption unavailable"
-                )
-
-                # Clean up
-                if Path(encrypted_path).exists():
-                    Path(encrypted_path).unlink()
-
-                # Move temp to final (unencrypted)
-                Path(temp_path).rename(full_path)
+            FileService._encrypt_into_place(temp_path, full_path, run_id, filename)
 
             logger.info(
                 "File stored successfully",
@@ -156,6 +147,125 @@ class FileService:
             )
             raise
 
+    @staticmethod
+    async def store_upload(
+        upload: UploadFile, filename: str, run_id: str
+    ) -> Tuple[str, str, str, int]:
+        """
+        Stream an upload to disk with encryption, hashing it on the way
+
+        At most UPLOAD_CHUNK_SIZE of the file is held in memory, and reading
+        stops as soon as the size limit is passed.
+
+        Returns:
+            Tuple of (full_path, redacted_path, checksum, file_size)
+
+        Raises:
+            FileSizeError: If the upload is empty or larger than MAX_FILE_SIZE
+        """
+        full_path, redacted_path = FileService.create_storage_path(run_id, filename)
+        temp_path = full_path + ".tmp"
+        run_dir = Path(full_path).parent
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        hasher = hashlib.sha256()
+        file_size = 0
+        try:
+            with open(temp_path, "wb") as f:
+                while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > settings.MAX_FILE_SIZE:
+                        raise FileSizeError(file_size)
+                    hasher.update(chunk)
+                    f.write(chunk)
+
+            if not FileService.validate_file_size(file_size):
+                raise FileSizeError(file_size)
+
+        except FileSizeError:
+            # Rejected uploads leave nothing behind; run_dir is unique to the run
+            Path(temp_path).unlink(missing_ok=True)
+            run_dir.rmdir()
+            raise
+
+        except Exception as e:
+            Path(temp_path).unlink(missing_ok=True)
+            logger.error(
+                "File storage failed",
+                run_id=run_id,
+                filename=filename,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+        checksum = hasher.hexdigest()
+        try:
+            FileService._encrypt_into_place(temp_path, full_path, run_id, filename)
+        except Exception as e:
+            # EncryptionError is handled inside; anything else (I/O, rename)
+            # leaves no temp or partial .enc file behind
+            Path(temp_path).unlink(missing_ok=True)
+            Path(full_path + ".enc").unlink(missing_ok=True)
+            logger.error(
+                "File storage failed",
+                run_id=run_id,
+                filename=filename,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+        logger.info(
+            "File stored successfully",
+            run_id=run_id,
+            filename=filename,
+            file_size=file_size,
+            checksum=checksum,
+            storage_path=redacted_path,
+        )
+
+        return full_path, redacted_path, checksum, file_size
+
+    @staticmethod
+    def _encrypt_into_place(temp_path: str, full_path: str, run_id: str, filename: str) -> None:
+        """Encrypt a stored temp file to its final path, or move it there as-is"""
+        encrypted_path = full_path + ".enc"
+
+        try:
+            encryption_metadata = get_encryption_service().encrypt_file(temp_path, encrypted_path)
+
+            # Move encrypted file to final location
+            Path(encrypted_path).rename(full_path)
+
+            # Remove temporary file
+            Path(temp_path).unlink()
+
+            logger.info(
+                "File stored and encrypted successfully",
+                run_id=run_id,
+                filename=filename,
+                original_size=encryption_metadata.get('original_size'),
+                encrypted_size=encryption_metadata.get('encrypted_size'),
+                encryption_time_ms=encryption_metadata.get('processing_time_ms')
+            )
+
+        except EncryptionError:
+            # Fallback: store unencrypted if encryption fails
+            logger.warning(
+                "Encryption failed, storing unencrypted file",
+                run_id=run_id,
+                filename=filename,
+                error="Encryption unavailable"
+            )
+
+            # Clean up
+            if Path(encrypted_path).exists():
+                Path(encrypted_path).unlink()
+
+            # Move temp to final (unencrypted)
+            Path(temp_path).rename(full_path)
+
     @staticmethod
     def read_encrypted_file(file_path: str) -> bytes:
         """
@@ -178,7 +288,7 @@ class FileService:
                 temp_decrypt_path = file_path.parent / f"{file_path.name}.decrypt_tmp"
 
                 # Decrypt to temporary file
-                decryption_metadata = encryption_service.decrypt_file(file_path, temp_decrypt_path)
+                decryption_metadata = get_encryption_service().decrypt_file(file_path, temp_decrypt_path)
 
                 # Read decrypted content
                 with open(temp_decrypt_path, 'rb') as f:
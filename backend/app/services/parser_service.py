@@ -85,7 +85,7 @@ class ParserService:
                         job_id=job_id,
                         resume_id=resume_id
                     )
-                    return ParsingJobResponse(
+                    return ParsingJobResponse.from_trusted(
                         job_id=job_id,
                         status="failed",
                         error=f"Resume with ID {resume_id} not found",
@@ -109,7 +109,7 @@ class ParserService:
                     job_id=job_id,
                     file_path=str(resolved_path)
                 )
-                return ParsingJobResponse(
+                return ParsingJobResponse.from_trusted(
                     job_id=job_id,
                     status="failed",
                     error="File not found",
@@ -171,7 +171,7 @@ class ParserService:
                     file_type=file_type,
                     file_path=str(resolved_path)
                 )
-                return ParsingJobResponse(
+                return ParsingJobResponse.from_trusted(
                     job_id=job_id,
                     status="failed",
                     error=f"Unsupported file type: {file_type}",
@@ -236,7 +236,7 @@ class ParserService:
             )
 
             end_time = datetime.now()
-            return ParsingJobResponse(
+            return ParsingJobResponse.from_trusted(
                 job_id=job_id,
                 status="completed",
                 result=result,
@@ -267,7 +267,7 @@ class ParserService:
                 metrics_trace_id=locals().get('trace_id', 'unknown'),
                 exc_info=True
             )
-            return ParsingJobResponse(
+            return ParsingJobResponse.from_trusted(
                 job_id=job_id,
                 status="failed",
                 error=f"{error_type}: {str(e)}",
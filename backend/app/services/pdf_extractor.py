@@ -59,6 +59,14 @@ class PDFExtractor:
     PHONE_PATTERN = re.compile(r'[\+]?[1-9]?[\d\s\-\(\)\.]{8,15}\d')
     URL_PATTERN = re.compile(r'https?://[^\s]+|www\.[^\s]+')
 
+    # The three contact patterns as one alternation, so text is scanned once;
+    # match.lastgroup names the kind. Where two could start at the same
+    # position, the earlier one in this order wins
+    CONTACT_PATTERN = re.compile('|'.join(
+        f'(?P<{kind}>{pattern.pattern})'
+        for kind, pattern in (('email', EMAIL_PATTERN), ('url', URL_PATTERN), ('phone', PHONE_PATTERN))
+    ))
+
     def __init__(self):
         if not pdfplumber or not PdfReader:
             raise ImportError("pdfplumber and PyPDF2 are required for PDF extraction")
@@ -319,22 +327,32 @@ class PDFExtractor:
 
     def _extract_contact_info(self, text: str) -> Dict[str, Any]:
         """Extract contact information (same as DOCX extractor)"""
-        contact = {}
-
-        # Extract email
-        emails = self.EMAIL_PATTERN.findall(text)
-        if emails:
-            contact['email'] = emails[0]
-
-        # Extract phone
-        phones = self.PHONE_PATTERN.findall(text)
-        if phones:
-            contact['phone'] = phones[0].strip()
+        email = None
+        phone = None
+        urls = []
+
+        # One scan: first email and phone, up to 3 URLs
+        for match in self.CONTACT_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if kind == 'email':
+                if email is None:
+                    email = match.group()
+            elif kind == 'url':
+                if len(urls) < 3:
+                    urls.append(match.group())
+            elif phone is None:
+                phone = match.group().strip()
+
+            if email is not None and phone is not None and len(urls) == 3:
+                break
 
-        # Extract URLs
-        urls = self.URL_PATTERN.findall(text)
+        contact = {}
+        if email:
+            contact['email'] = email
+        if phone:
+            contact['phone'] = phone
         if urls:
-            contact['urls'] = urls[:3]
+            contact['urls'] = urls
 
         return contact
 
@@ -4,10 +4,18 @@ Provides validation functions to ensure parser outputs conform to schema
 """
 
 import json
-from typing import Dict, Any, List, Tuple, Optional
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Any, List, Tuple, Optional, Union
 from pydantic import ValidationError
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.models.profile_schema import (
     ProfileJSONSchema,
     get_schema_version,
@@ -17,6 +25,27 @@ from app.models.profile_schema import (
 )
 
 logger = structlog.get_logger()
+# The stdlib logger structlog's LoggerFactory wraps for this module; its level
+# check works whether or not structlog has been configured
+_stdlib_logger = logging.getLogger(__name__)
+
+# File type reported in profile metadata, by lowercase extension
+_FILE_TYPES_BY_EXTENSION = {
+    'docx': 'docx',
+    'doc': 'docx',
+    'pdf': 'pdf',
+    'txt': 'txt',
+    'text': 'txt',
+}
+
+# Contact fields copied as-is from parser output; full_name also accepts
+# the parser's 'name' key, which takes precedence
+_CONTACT_FIELDS = (
+    'full_name', 'email', 'phone', 'location', 'website', 'linkedin', 'github', 'address',
+)
+
+# Both raise a ValueError subclass on malformed input
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 class ProfileValidationResult:
@@ -58,12 +87,16 @@ class ProfileValidator:
         Returns:
             ProfileValidationResult with validation details
         """
-        logger.info(
-            "Profile validation started",
-            job_id=job_id,
-            strict=strict,
-            data_keys=list(profile_data.keys()) if profile_data else []
-        )
+        # INFO logs below build key lists and counts; skip that work when
+        # INFO is filtered out
+        info_enabled = _stdlib_logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            logger.info(
+                "Profile validation started",
+                job_id=job_id,
+                strict=strict,
+                data_keys=list(profile_data.keys()) if profile_data else []
+            )
 
         errors = []
         warnings = []
@@ -84,26 +117,32 @@ class ProfileValidator:
                     if strict:
                         return ProfileValidationResult(False, errors=errors, warnings=warnings)
 
-            # Validate against Pydantic model
-            profile = ProfileJSONSchema(**profile_data)
-
-            logger.info(
-                "Profile validation completed successfully",
-                job_id=job_id,
-                schema_version=profile.schema_version,
-                sections=len([s for s in [profile.contact, profile.summary] if s is not None]) +
-                        len(profile.experience) + len(profile.education) + len(profile.skills),
-                warnings_count=len(warnings)
-            )
+            # Validate against Pydantic model. Entry lists are validated inside
+            # this same pydantic-core call; splitting them out into per-section
+            # TypeAdapters would not be faster and, paired with model_construct,
+            # would skip the profile-level privacy validators
+            profile = ProfileJSONSchema.model_validate(profile_data)
+
+            if info_enabled:
+                logger.info(
+                    "Profile validation completed successfully",
+                    job_id=job_id,
+                    schema_version=profile.schema_version,
+                    sections=len([s for s in [profile.contact, profile.summary] if s is not None]) +
+                            len(profile.experience) + len(profile.education) + len(profile.skills),
+                    warnings_count=len(warnings)
+                )
 
             return ProfileValidationResult(True, profile=profile, warnings=warnings)
 
         except ValidationError as e:
-            # Parse Pydantic validation errors
-            for error in e.errors():
-                field_path = " -> ".join(str(x) for x in error['loc'])
-                error_msg = f"Field '{field_path}': {error['msg']}"
-                errors.append(error_msg)
+            # Parse Pydantic validation errors; errors() rebuilds the list on
+            # every call, so it is read once and reused for cleaning below
+            validation_errors = e.errors(include_url=False)
+            errors.extend(
+                f"Field '{' -> '.join(map(str, error['loc']))}': {error['msg']}"
+                for error in validation_errors
+            )
 
             logger.warning(
                 "Profile validation failed with Pydantic errors",
@@ -116,8 +155,8 @@ class ProfileValidator:
                 # In non-strict mode, try to create a partial profile
                 try:
                     # Remove problematic fields and retry
-                    cleaned_data = ProfileValidator._clean_invalid_fields(profile_data, e.errors())
-                    profile = ProfileJSONSchema(**cleaned_data)
+                    cleaned_data = ProfileValidator._clean_invalid_fields(profile_data, validation_errors)
+                    profile = ProfileJSONSchema.model_validate(cleaned_data)
                     warnings.extend([f"Removed invalid field: {err}" for err in errors])
                     errors = []  # Convert errors to warnings in non-strict mode
 
@@ -142,14 +181,14 @@ class ProfileValidator:
             return ProfileValidationResult(False, errors=errors, warnings=warnings)
 
     @staticmethod
-    def validate_profile_json(profile_json: str,
+    def validate_profile_json(profile_json: Union[str, bytes],
                             strict: bool = True,
                             job_id: Optional[str] = None) -> ProfileValidationResult:
         """
         Validate a profile JSON string
 
         Args:
-            profile_json: JSON string containing profile data
+            profile_json: JSON text (str or raw UTF-8 bytes) containing profile data
             strict: Whether to perform strict validation
             job_id: Optional job ID for logging context
 
@@ -157,10 +196,8 @@ class ProfileValidator:
             ProfileValidationResult with validation details
         """
         try:
-            profile_data = json.loads(profile_json)
-            return ProfileValidator.validate_profile(profile_data, strict=strict, job_id=job_id)
-
-        except json.JSONDecodeError as e:
+            profile_data = _json_loads(profile_json)
+        except ValueError as e:
             logger.warning(
                 "Profile JSON parsing failed",
                 job_id=job_id,
@@ -168,6 +205,8 @@ class ProfileValidator:
             )
             return ProfileValidationResult(False, errors=[f"Invalid JSON: {str(e)}"])
 
+        return ProfileValidator.validate_profile(profile_data, strict=strict, job_id=job_id)
+
     @staticmethod
     def validate_parser_output(parser_result: Dict[str, Any],
                              job_id: Optional[str] = None) -> ProfileValidationResult:
@@ -181,12 +220,13 @@ class ProfileValidator:
         Returns:
             ProfileValidationResult with validation details
         """
-        logger.info(
-            "Parser output validation started",
-            job_id=job_id,
-            has_result=parser_result is not None,
-            result_keys=list(parser_result.keys()) if parser_result else []
-        )
+        if _stdlib_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Parser output validation started",
+                job_id=job_id,
+                has_result=parser_result is not None,
+                result_keys=list(parser_result.keys()) if parser_result else []
+            )
 
         if not parser_result:
             return ProfileValidationResult(False, errors=["Parser result is empty"])
@@ -218,58 +258,43 @@ class ProfileValidator:
         Returns:
             Dictionary conforming to ProfileJSON schema
         """
-        from datetime import datetime
-        import os
-
         # Extract file name without path for privacy
         source_file = parser_result.get('file_path', 'unknown.docx')
         if source_file and '/' in source_file:
             source_file = os.path.basename(source_file)
 
+        # Looked up once; every section and metadata field reads from these
+        sections = parser_result.get('sections', {})
+        parser_metadata = parser_result.get('metadata', {})
+
+        # One timestamp for both generated_at and extraction_timestamp
+        now = datetime.now()
+
         # Build ProfileJSON structure
         profile_data = {
             "schema_version": get_schema_version(),
-            "generated_at": datetime.now(),
+            "generated_at": now,
             "extraction_method": parser_result.get('extraction_method', 'unknown'),
             "source_file": source_file,
 
-            # Transform sections
-            "contact": ProfileValidator._extract_contact_section(
-                parser_result.get('sections', {}).get('contact', {})
-            ),
-            "summary": ProfileValidator._extract_summary_section(
-                parser_result.get('sections', {}).get('summary')
-            ),
-            "experience": ProfileValidator._extract_experience_section(
-                parser_result.get('sections', {}).get('experience', [])
-            ),
-            "education": ProfileValidator._extract_education_section(
-                parser_result.get('sections', {}).get('education', [])
-            ),
-            "skills": ProfileValidator._extract_skills_section(
-                parser_result.get('sections', {}).get('skills', [])
-            ),
-            "projects": ProfileValidator._extract_projects_section(
-                parser_result.get('sections', {}).get('projects', [])
-            ),
-            "achievements": ProfileValidator._extract_achievements_section(
-                parser_result.get('sections', {}).get('achievements', [])
-            ),
-
             # Metadata
             "metadata": {
-                "extractor_version": parser_result.get('metadata', {}).get('extractor_version', '0.1.0'),
-                "extraction_timestamp": datetime.now(),
-                "confidence_score": parser_result.get('metadata', {}).get('confidence_score', 0.0),
+                "extractor_version": parser_metadata.get('extractor_version', '0.1.0'),
+                "extraction_timestamp": now,
+                "confidence_score": parser_metadata.get('confidence_score', 0.0),
                 "source_file_hash": None,  # Not available from current parser
                 "file_type": ProfileValidator._detect_file_type(source_file),
-                "sections_detected": list(parser_result.get('sections', {}).keys())
+                "sections_detected": list(sections.keys())
             },
 
             "warnings": parser_result.get('warnings', []),
             "errors": []
         }
 
+        # Transform sections
+        for name, extract, default in _SECTION_EXTRACTORS:
+            profile_data[name] = extract(sections.get(name, default))
+
         return profile_data
 
     @staticmethod
@@ -278,17 +303,10 @@ class ProfileValidator:
         if not contact_data:
             return None
 
-        return {
-            "full_name": contact_data.get('name') or contact_data.get('full_name'),
-            "email": contact_data.get('email'),
-            "phone": contact_data.get('phone'),
-            "location": contact_data.get('location'),
-            "website": contact_data.get('website'),
-            "linkedin": contact_data.get('linkedin'),
-            "github": contact_data.get('github'),
-            "address": contact_data.get('address'),
-            "social_profiles": contact_data.get('social_profiles', {})
-        }
+        contact = {key: contact_data.get(key) for key in _CONTACT_FIELDS}
+        contact["full_name"] = contact_data.get('name') or contact["full_name"]
+        contact["social_profiles"] = contact_data.get('social_profiles', {})
+        return contact
 
     @staticmethod
     def _extract_summary_section(summary_data) -> Optional[Dict[str, Any]]:
@@ -458,15 +476,10 @@ class ProfileValidator:
         if not filename:
             return 'unknown'
 
-        extension = filename.lower().split('.')[-1] if '.' in filename else ''
-        if extension in ['docx', 'doc']:
-            return 'docx'
-        elif extension == 'pdf':
-            return 'pdf'
-        elif extension in ['txt', 'text']:
-            return 'txt'
-        else:
+        _, dot, extension = filename.rpartition('.')
+        if not dot:
             return 'unknown'
+        return _FILE_TYPES_BY_EXTENSION.get(extension.lower(), 'unknown')
 
     @staticmethod
     def _clean_invalid_fields(profile_data: Dict[str, Any],
@@ -481,17 +494,26 @@ class ProfileValidator:
         Returns:
             Cleaned profile data
         """
-        cleaned_data = profile_data.copy()
+        # Only errors on top-level fields drop anything
+        invalid_fields = {
+            error['loc'][0] for error in validation_errors if len(error['loc']) == 1
+        }
+        if not invalid_fields:
+            return profile_data.copy()
+
+        return {key: value for key, value in profile_data.items() if key not in invalid_fields}
 
-        for error in validation_errors:
-            field_path = error['loc']
-            if len(field_path) == 1:
-                # Top-level field
-                field_name = field_path[0]
-                if field_name in cleaned_data:
-                    del cleaned_data[field_name]
 
-        return cleaned_data
+# (section name, extractor, default when the parser omitted the section)
+_SECTION_EXTRACTORS = (
+    ('contact', ProfileValidator._extract_contact_section, {}),
+    ('summary', ProfileValidator._extract_summary_section, None),
+    ('experience', ProfileValidator._extract_experience_section, []),
+    ('education', ProfileValidator._extract_education_section, []),
+    ('skills', ProfileValidator._extract_skills_section, []),
+    ('projects', ProfileValidator._extract_projects_section, []),
+    ('achievements', ProfileValidator._extract_achievements_section, []),
+)
 
 
 # Convenience functions for common validation scenarios